@@ -118,6 +118,10 @@ install_python_deps() {
     source venv/bin/activate
     pip install \
         "websockets>=10.0" \
+        "msgpack>=1.0.0" \
+        "msgspec>=0.15.0" \
+        "orjson>=3.6.0" \
+        "uvloop>=0.16.0" \
         "pyserial>=3.5" \
         "psutil>=5.8.0" \
         "pygame>=2.1.0" \
@@ -26,8 +26,11 @@ import logging
 import os
 import sys
 import signal
+import socket
 import subprocess
+import threading
 import psutil
+import requests
 import pygame
 from pathlib import Path
 from typing import Dict, List, Optional, Any
@@ -57,6 +60,7 @@ from modules.gpio_compat import setup_output_pin, set_output, is_gpio_available
 from modules.sd_watchdog import SystemdWatchdog
 from modules.health_supervisor import HealthSupervisor
 from modules.file_utils import save_json_atomic
+from modules.wire_codec import encode_json, encode_message
 from web.webapp import DroidDeckWebServer
 
 logger = logging.getLogger(__name__)
@@ -79,6 +83,13 @@ except ImportError:
     BOTTANGO_LIVE_AVAILABLE = False
     BOTTANGO_LIVE_PORT = 59225
 
+# uvloop (libuv-backed event loop) is optional - stock asyncio otherwise
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 class SystemState(Enum):
     NORMAL = "normal"
     FAILSAFE = "failsafe"
@@ -94,6 +105,8 @@ class WALLEBackend:
         self.state = SystemState.FAILSAFE
         self.failsafe_active = True
         self.connected_clients = set()
+        # Clients sent to per event-loop turn; up to this many get a single gather with no yield
+        self.broadcast_batch_size = max(1, int(self.config.get("websocket", {}).get("broadcast_batch_size", 50)))
         self.telemetry_task = None
         self.websocket_server = None
         self.loop = None
@@ -136,6 +149,9 @@ class WALLEBackend:
 
         # Camera proxy configuration
         self.camera_proxy_url = config_dict.get("camera", {}).get("proxy_url", "http://10.1.1.230:8081")
+        # Per-thread requests.Session for camera proxy calls - see camera_session
+        self._camera_sessions = threading.local()
+        self._all_camera_sessions: List[requests.Session] = []
         
         # Initialize modular components
         self.hardware_service = create_hardware_service(config_dict)
@@ -561,26 +577,78 @@ class WALLEBackend:
         
         return {"running": False}
 
-    async def broadcast_message(self, message: Dict[str, Any]):
-        """Broadcast message to all connected clients (both WebSocket and Web Server)"""
+    @property
+    def has_clients(self) -> bool:
+        """True when any WebSocket or web (Socket.IO) client is connected.
+
+        Periodic producers check this before building a payload so idle
+        deployments skip the dict construction and JSON encode entirely.
+        """
+        if self.connected_clients:
+            return True
+        web_server = getattr(self, 'web_server', None)
+        return bool(web_server and web_server.has_clients)
+
+    async def broadcast_message(self, message: Dict[str, Any], exclude=None):
+        """Broadcast message to all connected clients (both WebSocket and Web Server)
+
+        exclude: optional WebSocket client that already received the message
+        """
+        await self.broadcast_messages([message], exclude=exclude)
+
+    async def broadcast_messages(self, messages: List[Dict[str, Any]], exclude=None):
+        """Broadcast several messages to all connected clients in order
+
+        Clients that opted in to batch frames receive a single
+        {"type": "batch", "messages": [...]} frame; everyone else gets one
+        frame per message as before.
+
+        exclude: optional WebSocket client that already received the messages
+        """
         
         # Broadcast to WebSocket clients (PyQt app)
-        if self.connected_clients:
-            message_json = json.dumps(message)
+        if self.connected_clients and messages:
+            handler = self.websocket_handler
+            # Encode once per (wire format, batch) combination, not once per client
+            encoded = {}
             disconnected_clients = set()
+            clients = [c for c in self.connected_clients if c is not exclude]
+            batch_size = self.broadcast_batch_size
+            batched = len(messages) > 1
             
-            for websocket in list(self.connected_clients):
-                try:
-                    await websocket.send(message_json)
-                except websockets.exceptions.ConnectionClosed:
-                    disconnected_clients.add(websocket)
-                except Exception as e:
-                    logger.debug(f"Error broadcasting to client: {e}")
-                    disconnected_clients.add(websocket)
+            # Send to a batch of clients concurrently, then yield to the
+            # event loop before the next batch so a broadcast storm (e.g.
+            # rapid NEMA position updates) cannot stall servo ticks
+            for start in range(0, len(clients), batch_size):
+                batch = clients[start:start + batch_size]
+                sends = []
+                for websocket in batch:
+                    key = (handler.wire_format_for(websocket), batched and handler.accepts_batch(websocket))
+                    payloads = encoded.get(key)
+                    if payloads is None:
+                        wire_format, as_batch = key
+                        if as_batch:
+                            payloads = [encode_message({"type": "batch", "messages": messages}, wire_format)]
+                        else:
+                            payloads = [encode_message(message, wire_format) for message in messages]
+                        encoded[key] = payloads
+                    sends.append(self._send_frames(websocket, payloads))
+                
+                results = await asyncio.gather(*sends, return_exceptions=True)
+                for websocket, result in zip(batch, results):
+                    if isinstance(result, websockets.exceptions.ConnectionClosed):
+                        disconnected_clients.add(websocket)
+                    elif isinstance(result, Exception):
+                        logger.debug(f"Error broadcasting to client: {result}")
+                        disconnected_clients.add(websocket)
+                
+                if start + batch_size < len(clients):
+                    await asyncio.sleep(0)
             
             # Remove disconnected clients
             for websocket in disconnected_clients:
                 self.connected_clients.discard(websocket)
+                handler.client_disconnected(websocket)
             
             if disconnected_clients:
                 logger.debug(f"Removed {len(disconnected_clients)} disconnected clients")
@@ -588,10 +656,16 @@ class WALLEBackend:
         # Also broadcast to web server (Socket.IO clients)
         if hasattr(self, 'web_server') and self.web_server:
             try:
-                self.web_server.broadcast_message(message)
+                for message in messages:
+                    self.web_server.broadcast_message(message)
             except Exception as e:
                 logger.debug(f"Error broadcasting to web server: {e}")
 
+    async def _send_frames(self, websocket, payloads: list):
+        """Send pre-encoded frames to one client in order"""
+        for payload in payloads:
+            await self.websocket_handler.send_frame(websocket, payload)
+
     def setup_signal_handlers(self):
         """Setup graceful shutdown signal handlers"""
         def signal_handler(signum, frame):
@@ -634,11 +708,15 @@ class WALLEBackend:
                 client_info = "unknown_client"
             
             logger.info(f"Client connected: {client_info}")
+            self._tune_client_socket(websocket)
             self.connected_clients.add(websocket)
             
             # Send initial system status
             await self.send_initial_status(websocket)
             
+            # Later sends go through the client's queued writer
+            self.websocket_handler.client_connected(websocket)
+            
             # Handle messages from this client
             while True:
                 try:
@@ -655,6 +733,7 @@ class WALLEBackend:
             logger.error(f"WebSocket connection error for {client_info}: {e}")
         finally:
             # Clean up
+            self.websocket_handler.client_disconnected(websocket)
             if websocket in self.connected_clients:
                 self.connected_clients.remove(websocket)
                 logger.info(f"Client {client_info} removed from connected clients")
@@ -663,13 +742,27 @@ class WALLEBackend:
         """Send initial system status to newly connected client"""
         try:
             status = await self.get_system_status()
-            await websocket.send(json.dumps({
+            await websocket.send(encode_json({
                 "type": "initial_status",
                 "data": status
             }))
         except Exception as e:
             logger.error(f"Failed to send initial status: {e}")
 
+    def camera_session(self) -> requests.Session:
+        """requests.Session for camera proxy calls from the calling thread.
+
+        Reusing a session keeps the HTTP connection to the proxy alive
+        instead of opening a new TCP connection per settings update.
+        Sessions are not documented as thread-safe, so each executor
+        thread gets its own - call this from inside the executor job.
+        """
+        session = getattr(self._camera_sessions, "session", None)
+        if session is None:
+            session = self._camera_sessions.session = requests.Session()
+            self._all_camera_sessions.append(session)
+        return session
+
     async def handle_camera_config_update(self, data: Dict[str, Any]):
         """Handle camera configuration updates from WebSocket with proxy communication"""
         try:
@@ -678,12 +771,11 @@ class WALLEBackend:
             
             # Send settings to camera proxy - the blocking HTTP call runs in
             # the executor so the event loop (and servo motion) never stalls
-            import requests
             loop = asyncio.get_running_loop()
             try:
                 response = await loop.run_in_executor(
                     None,
-                    lambda: requests.post(
+                    lambda: self.camera_session().post(
                         f"{self.camera_proxy_url}/camera/settings",
                         json=config_updates,
                         timeout=5
@@ -812,6 +904,11 @@ class WALLEBackend:
 
                 reading = await self.telemetry_system.update(hardware_status)
 
+                # Readings and alerts are still recorded above; only the
+                # broadcast payload is skipped when nobody is listening
+                if not self.has_clients:
+                    return
+
                 controller_info = {}
                 if hasattr(self, 'bluetooth_controller'):
                     controller_info = self.bluetooth_controller.get_controller_info()
@@ -956,6 +1053,74 @@ class WALLEBackend:
             "timestamp": time.time()
         })
 
+    def _websocket_compression_options(self) -> Dict[str, Any]:
+        """Build the permessage-deflate settings for the WebSocket server.
+
+        Off by default: almost all traffic is controller, heartbeat, gesture
+        and error frames under 200 bytes, where deflate costs a zlib
+        compress/flush per message for no bandwidth win on the LAN. Since
+        websockets has no per-message opt-out, "compression": true in the
+        optional "websocket" config section enables it for every frame,
+        tuned for speed: level 1 and 2 KB windows.
+        """
+        ws_config = self.config.get("websocket", {})
+        if not ws_config.get("compression", False):
+            return {"compression": None}
+
+        from websockets.extensions.permessage_deflate import ServerPerMessageDeflateFactory
+        window_bits = ws_config.get("window_bits", 11)
+        return {
+            "compression": None,  # replaced by the explicit factory below
+            "extensions": [
+                ServerPerMessageDeflateFactory(
+                    server_max_window_bits=window_bits,
+                    client_max_window_bits=window_bits,
+                    compress_settings={"level": ws_config.get("level", 1), "memLevel": 4},
+                )
+            ],
+        }
+
+    def _websocket_buffer_options(self) -> Dict[str, Any]:
+        """Build the write buffer settings for the WebSocket server.
+
+        NEMA sweeps broadcast nema_position_update at tens of Hz to every
+        tablet; a 1 MB write limit lets those bursts queue in the transport
+        instead of stalling the send path on drain().
+        """
+        ws_config = self.config.get("websocket", {})
+        return {"write_limit": ws_config.get("write_limit", 1 << 20)}
+
+    def _tune_client_socket(self, websocket):
+        """Enlarge the send buffer and disable Nagle on an accepted client socket"""
+        transport = getattr(websocket, "transport", None)
+        sock = transport.get_extra_info("socket") if transport else None
+        if sock is None:
+            return
+        ws_config = self.config.get("websocket", {})
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, ws_config.get("sndbuf", 1 << 20))
+            # Position updates are small and latency-sensitive - send them immediately
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError as e:
+            logger.debug(f"Could not tune client socket options: {e}")
+
+    def _install_task_factory(self):
+        """Optionally run new tasks eagerly on Python 3.12+.
+
+        Off by default: eager tasks run inline up to their first await,
+        which changes scheduling order for code written against the normal
+        loop. Set "asyncio": {"eager_tasks": true} in the config to opt in;
+        older runtimes keep the default factory either way.
+        """
+        if not self.config.get("asyncio", {}).get("eager_tasks", False):
+            return
+        eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_task_factory is None:
+            logger.info("Eager task factory needs Python 3.12+ - using default task scheduling")
+            return
+        self.loop.set_task_factory(eager_task_factory)
+        logger.info("Using eager asyncio task factory")
+
     # ==================== SYSTEM LIFECYCLE ====================
     async def _on_bottango_scenes_updated(self):
         """Called by BottangoFolderWatcher when new scenes have been converted."""
@@ -975,6 +1140,7 @@ class WALLEBackend:
         self.start_time = time.time()
         self.running = True
         self.loop = asyncio.get_running_loop()
+        self._install_task_factory()
                 
         self.web_server.start()
         logger.info("Web interface available at: http://0.0.0.0:5000")
@@ -1040,6 +1206,8 @@ class WALLEBackend:
             
             # Start WebSocket server with version-appropriate method
             logger.info("Starting WebSocket server on port 8766")
+            compression_options = self._websocket_compression_options()
+            compression_options.update(self._websocket_buffer_options())
             
             if WEBSOCKETS_MAJOR >= 13:
                 # websockets 13+ (including 15.0.1)
@@ -1049,7 +1217,8 @@ class WALLEBackend:
                     8766,
                     ping_interval=30,
                     ping_timeout=10,
-                    close_timeout=5
+                    close_timeout=5,
+                    **compression_options
                 )
             else:
                 # older websockets versions
@@ -1059,7 +1228,8 @@ class WALLEBackend:
                     8766,
                     ping_interval=30,
                     ping_timeout=10,
-                    close_timeout=5
+                    close_timeout=5,
+                    **compression_options
                 )
             
             # Get network info for logging
@@ -1126,6 +1296,9 @@ class WALLEBackend:
         if hasattr(self, 'web_server'):
             self.web_server.stop()
 
+        for session in self._all_camera_sessions:
+            session.close()
+
         if hasattr(self, 'bottango_watcher') and self.bottango_watcher:
             self.bottango_watcher.stop()
 
@@ -1160,6 +1333,9 @@ class WALLEBackend:
                 except (asyncio.CancelledError, asyncio.TimeoutError):
                     logger.info("Telemetry task stopped")
             
+            # Stop the gesture scene worker so it is not destroyed while pending
+            await self.websocket_handler.stop_gesture_worker()
+            
             # 3. Close client connections
             if self.connected_clients:
                 logger.info(f"Closing {len(self.connected_clients)} client connections...")
@@ -1739,6 +1915,14 @@ if __name__ == "__main__":
     # Setup logging first
     setup_logging()
     
+    # Use uvloop when installed - faster scheduling and call_soon_threadsafe
+    # for the serial-thread callbacks and WebSocket traffic
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop")
+    else:
+        logger.info("uvloop not installed - using default asyncio event loop")
+    
     try:
         # Run the main coroutine
         asyncio.run(main())
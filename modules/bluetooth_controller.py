@@ -152,6 +152,9 @@ class OptimizedBluetoothController:
         self.calibration_mode = False
         self.calibration_streaming = False  # FIXED: Proper calibration streaming flag
         self.calibration_stream_task = None
+        # Latest full input read from calibration_stream_loop, so status
+        # requests can reuse it instead of polling SDL again
+        self.calibration_snapshot: Optional[Dict[str, Any]] = None
 
         # FIXED: Reduced navigation cooldown for responsive D-pad
         self.last_navigation_time = 0
@@ -556,28 +559,34 @@ class OptimizedBluetoothController:
                     "timestamp": time.time()
                 }
                 
-                # Read all axes
-                for axis_id in range(self.joystick.get_numaxes()):
-                    raw_value = self.joystick.get_axis(axis_id)
-                    calibrated_value, in_dead_zone = self.calibration.get_calibrated_value(axis_id, raw_value)
-                    
-                    axis_name = self.axis_map.get(axis_id, f"axis_{axis_id}")
-                    calibration_data[axis_name] = calibrated_value
+                # Read every axis once; calibrated and raw values both come from this
+                joystick = self.joystick
+                get_axis = joystick.get_axis
+                raw_axes = [get_axis(axis_id) for axis_id in range(joystick.get_numaxes())]
+                # Pad to the six axes the calibration screen expects
+                padded = raw_axes + [0.0] * (6 - len(raw_axes))
+                
+                get_calibrated_value = self.calibration.get_calibrated_value
+                axis_map_get = self.axis_map.get
+                for axis_id, raw_value in enumerate(raw_axes):
+                    calibrated_value, in_dead_zone = get_calibrated_value(axis_id, raw_value)
+                    calibration_data[axis_map_get(axis_id, f"axis_{axis_id}")] = calibrated_value
                 
                 # Add raw values for calibration screen
                 calibration_data.update({
-                    "left_stick_x": self.joystick.get_axis(0) if self.joystick.get_numaxes() > 0 else 0.0,
-                    "left_stick_y": -self.joystick.get_axis(1) if self.joystick.get_numaxes() > 1 else 0.0,
-                    "right_stick_x": self.joystick.get_axis(2) if self.joystick.get_numaxes() > 2 else 0.0,
-                    "right_stick_y": -self.joystick.get_axis(3) if self.joystick.get_numaxes() > 3 else 0.0,
-                    "left_trigger": max(0, self.joystick.get_axis(4)) if self.joystick.get_numaxes() > 4 else 0.0,
-                    "right_trigger": max(0, self.joystick.get_axis(5)) if self.joystick.get_numaxes() > 5 else 0.0,
+                    "left_stick_x": padded[0],
+                    "left_stick_y": -padded[1] if len(raw_axes) > 1 else 0.0,
+                    "right_stick_x": padded[2],
+                    "right_stick_y": -padded[3] if len(raw_axes) > 3 else 0.0,
+                    "left_trigger": max(0, padded[4]) if len(raw_axes) > 4 else 0.0,
+                    "right_trigger": max(0, padded[5]) if len(raw_axes) > 5 else 0.0,
                 })
                 
                 # Read buttons
-                for button_id in range(self.joystick.get_numbuttons()):
-                    button_name = self.button_map.get(button_id, f"button_{button_id}")
-                    calibration_data[button_name] = bool(self.joystick.get_button(button_id))
+                get_button = joystick.get_button
+                button_map_get = self.button_map.get
+                for button_id in range(joystick.get_numbuttons()):
+                    calibration_data[button_map_get(button_id, f"button_{button_id}")] = bool(get_button(button_id))
                 
                 # Read D-pad
                 if self.joystick.get_numhats() > 0:
@@ -589,6 +598,8 @@ class OptimizedBluetoothController:
                         "dpad_right": hat_x > 0,
                     })
                 
+                self.calibration_snapshot = calibration_data
+                
                 # Broadcast calibration data
                 if self.websocket_broadcast:
                     await self.websocket_broadcast(calibration_data)
@@ -677,6 +688,7 @@ class OptimizedBluetoothController:
                     # Stop calibration streaming
                     self.calibration_stream_task.cancel()
                     self.calibration_stream_task = None
+                    self.calibration_snapshot = None
                     logger.info("Stopped calibration streaming")
                 
                 # Enhanced reconnection logic for disconnected controllers
@@ -734,6 +746,13 @@ class OptimizedBluetoothController:
         
         logger.info("Optimized controller service stopped")
     
+    def get_calibration_snapshot(self, max_age: float = 0.5) -> Optional[Dict[str, Any]]:
+        """Return the last streamed calibration sample if it is recent enough"""
+        snapshot = self.calibration_snapshot
+        if snapshot is None or time.time() - snapshot["timestamp"] > max_age:
+            return None
+        return snapshot
+
     def get_controller_info(self) -> Dict:
         """Get current controller information"""
         return {
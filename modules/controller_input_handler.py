@@ -138,7 +138,7 @@ class DirectServoHandler(BehaviorHandler):
                 # Debug: log mixer-routed joystick targets for key servos
                 try:
                     if servo_channel in ('m1_ch0','m1_ch1'):
-                        logger.debug(f"[JOY->MIX] {servo_channel} raw={controller_input.raw_value:.3f} pulse={pulse} offset={center_offset} locked={channel_locked}")
+                        logger.debug("[JOY->MIX] %s raw=%.3f pulse=%s offset=%s locked=%s", servo_channel, controller_input.raw_value, pulse, center_offset, channel_locked)
                 except Exception:
                     pass
                 self._set_mixer_target(servo_channel, float(pulse))
@@ -152,7 +152,7 @@ class DirectServoHandler(BehaviorHandler):
                 return True
             
             if success:
-                self.logger.debug(f"Direct servo {servo_channel}: {pulse} (raw: {controller_input.raw_value:.2f}, offset: {center_offset})")
+                self.logger.debug("Direct servo %s: %s (raw: %.2f, offset: %s)", servo_channel, pulse, controller_input.raw_value, center_offset)
                 
                 self.last_sent_values[servo_channel] = value
             return success
@@ -258,7 +258,7 @@ class MultiServoHandler(BehaviorHandler):
                 
                 if success:
                     state['last_pulses'][channel] = target_pulse
-                    self.logger.debug(f"Multi servo button {channel}: {target_pulse} ({'pressed' if is_pressed else 'released'})")
+                    self.logger.debug("Multi servo button %s: %s (%s)", channel, target_pulse, 'pressed' if is_pressed else 'released')
                     success_count += 1
         
         return success_count > 0
@@ -314,7 +314,7 @@ class MultiServoHandler(BehaviorHandler):
                 )
             
             if success:
-                self.logger.debug(f"Multi servo {channel}: {pulse} (raw: {controller_input.raw_value:.2f}, inverted: {invert})")
+                self.logger.debug("Multi servo %s: %s (raw: %.2f, inverted: %s)", channel, pulse, controller_input.raw_value, invert)
                 self.last_sent_values[channel] = value
                 success_count += 1
         
@@ -376,7 +376,7 @@ class ToggleServoHandler(BehaviorHandler):
                     
                     if success:
                         state['last_pulse_sent'] = target_pulse
-                        self.logger.debug(f"Hold servo {servo_channel}: {target_pulse} ({'held' if is_pressed else 'released'})")
+                        self.logger.debug("Hold servo %s: %s (%s)", servo_channel, target_pulse, 'held' if is_pressed else 'released')
                         return True
                 
                 return False
@@ -416,7 +416,7 @@ class ToggleServoHandler(BehaviorHandler):
                     
                     if success:
                         state['last_pulse_sent'] = pulse
-                        self.logger.debug(f"Toggle servo {servo_channel}: {pulse} (position {3 - state['current_position']})")
+                        self.logger.debug("Toggle servo %s: %s (position %s)", servo_channel, pulse, 3 - state['current_position'])
                     
                     return success
                 
@@ -474,7 +474,7 @@ class JoystickPairHandler(BehaviorHandler):
                     self._set_mixer_target(x_servo, float(pulse))
                     try:
                         if x_servo in ('m1_ch0','m1_ch1'):
-                            logger.debug(f"[JOYPAIR->MIX] X {x_servo} raw={controller_input.raw_value:.3f} pulse={pulse} offset={x_center_offset} locked={x_locked}")
+                            logger.debug("[JOYPAIR->MIX] X %s raw=%.3f pulse=%s offset=%s locked=%s", x_servo, controller_input.raw_value, pulse, x_center_offset, x_locked)
                     except Exception:
                         pass
                     success = True
@@ -485,7 +485,7 @@ class JoystickPairHandler(BehaviorHandler):
                 
                 if success:
                     self.last_x_value = controller_input.raw_value
-                    self.logger.debug(f"Joystick X {x_servo}: {pulse} (offset: {x_center_offset})")
+                    self.logger.debug("Joystick X %s: %s (offset: %s)", x_servo, pulse, x_center_offset)
             
             # Handle Y axis
             elif controller_input.control_name.endswith('_y'):
@@ -504,7 +504,7 @@ class JoystickPairHandler(BehaviorHandler):
                     self._set_mixer_target(y_servo, float(pulse))
                     try:
                         if y_servo in ('m1_ch0','m1_ch1'):
-                            logger.debug(f"[JOYPAIR->MIX] Y {y_servo} raw={controller_input.raw_value:.3f} pulse={pulse} offset={y_center_offset} locked={y_locked}")
+                            logger.debug("[JOYPAIR->MIX] Y %s raw=%.3f pulse=%s offset=%s locked=%s", y_servo, controller_input.raw_value, pulse, y_center_offset, y_locked)
                     except Exception:
                         pass
                     success = True
@@ -515,7 +515,7 @@ class JoystickPairHandler(BehaviorHandler):
                 
                 if success:
                     self.last_y_value = controller_input.raw_value
-                    self.logger.debug(f"Joystick Y {y_servo}: {pulse} (offset: {y_center_offset})")
+                    self.logger.debug("Joystick Y %s: %s (offset: %s)", y_servo, pulse, y_center_offset)
             
             return success
             
@@ -662,7 +662,7 @@ class DifferentialTracksHandler(BehaviorHandler):
             if left_success and right_success:
                 self.last_sent_left = left_speed
                 self.last_sent_right = right_speed
-                self.logger.debug(f"Differential tracks L:{left_pulse} R:{right_pulse}")
+                self.logger.debug("Differential tracks L:%s R:%s", left_pulse, right_pulse)
             
             return left_success and right_success
             
@@ -7,6 +7,9 @@ Provides atomic JSON persistence so that a power loss or crash mid-write
 can never leave a truncated or corrupted config file on disk. Files are
 written to a temporary sibling path, flushed and fsynced, then moved into
 place with os.replace() which is atomic on ext4.
+
+JSON is written and parsed with orjson when it is installed, using the
+stdlib json module otherwise (or for data orjson cannot serialise).
 """
 
 import json
@@ -17,6 +20,24 @@ from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# orjson is optional - the stdlib json module is the fallback
+ORJSON_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    logger.info("orjson not available - using stdlib json for config files")
+
+
+def _dumps_bytes(data: Any, indent: int) -> bytes:
+    """Serialise data to UTF-8 JSON bytes with the given indentation"""
+    if ORJSON_AVAILABLE and indent == 2:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(data, indent=indent, ensure_ascii=False).encode("utf-8")
+
 
 def save_json_atomic(path, data: Any, indent: int = 2) -> bool:
     """
@@ -39,8 +60,9 @@ def save_json_atomic(path, data: Any, indent: int = 2) -> bool:
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(tmp_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=indent, ensure_ascii=False)
+        payload = _dumps_bytes(data, indent)
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
             f.flush()
             os.fsync(f.fileno())
 
@@ -72,6 +94,9 @@ def load_json_safe(path, default: Optional[Any] = None) -> Any:
     try:
         if not path.exists():
             return default
+        if ORJSON_AVAILABLE:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            return orjson.loads(path.read_bytes())
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
     except json.JSONDecodeError as e:
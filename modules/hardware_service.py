@@ -413,14 +413,14 @@ class HardwareService:
                     actual_batch_time = execution_time * 1000
                     self.batch_stats["time_saved_ms"] += max(0, estimated_individual_time - actual_batch_time)
                     
-                    logger.debug(f"Sent batch command to {maestro_id}: {servo_count} servos in {execution_time*1000:.1f}ms")
+                    logger.debug("Sent batch command to %s: %s servos in %.1fms", maestro_id, servo_count, execution_time*1000)
                     return True
                 else:
                     logger.warning(f"Enhanced batch command failed for {maestro_id}, falling back to individual commands")
                     self.batch_stats["batch_command_errors"] += 1
             
             # Fallback: Send individual commands if batch not supported
-            logger.debug(f"Using individual commands for {maestro_id}: {len(servo_configs)} servos")
+            logger.debug("Using individual commands for %s: %s servos", maestro_id, len(servo_configs))
             return await self._send_individual_servo_commands(maestro_id, servo_configs, priority)
             
         except Exception as e:
@@ -541,7 +541,7 @@ class HardwareService:
                 success &= maestro1_success
                 
                 if maestro1_success:
-                    logger.debug(f"Maestro 1 batch: {len(maestro1_servos)} servos")
+                    logger.debug("Maestro 1 batch: %s servos", len(maestro1_servos))
                 else:
                     logger.warning("Maestro 1 batch failed")
             
@@ -552,7 +552,7 @@ class HardwareService:
                 success &= maestro2_success
                 
                 if maestro2_success:
-                    logger.debug(f"Maestro 2 batch: {len(maestro2_servos)} servos")
+                    logger.debug("Maestro 2 batch: %s servos", len(maestro2_servos))
                 else:
                     logger.warning("Maestro 2 batch failed")
             
@@ -593,7 +593,7 @@ class HardwareService:
             if hasattr(self, 'backend_reference'):
                 if self.backend_reference.is_track_channel(channel_key):
                     if self.backend_reference.failsafe_active:
-                        logger.debug(f"Track command blocked by failsafe: {channel_key}")
+                        logger.debug("Track command blocked by failsafe: %s", channel_key)
                         return False
                     else:
                         self.backend_reference.track_last_command_time[channel_key] = time.time()
@@ -615,7 +615,7 @@ class HardwareService:
             success = maestro.set_target(channel, position, priority=cmd_priority)
             
             if success:
-                logger.debug(f"Servo {channel_key} -> {position} ({priority})")
+                logger.debug("Servo %s -> %s (%s)", channel_key, position, priority)
                 # Update individual command statistics
                 self.batch_stats["individual_commands_sent"] += 1
             else:
@@ -634,7 +634,7 @@ class HardwareService:
             maestro = self.maestro1 if maestro_num == 1 else self.maestro2
             
             success = maestro.set_speed(channel, speed)
-            logger.debug(f"Servo speed {channel_key} -> {speed}")
+            logger.debug("Servo speed %s -> %s", channel_key, speed)
             return success
             
         except Exception as e:
@@ -648,7 +648,7 @@ class HardwareService:
             maestro = self.maestro1 if maestro_num == 1 else self.maestro2
             
             success = maestro.set_acceleration(channel, acceleration)
-            logger.debug(f"Servo acceleration {channel_key} -> {acceleration}")
+            logger.debug("Servo acceleration %s -> %s", channel_key, acceleration)
             return success
             
         except Exception as e:
@@ -1799,15 +1799,21 @@ class HardwareService:
         logger.debug(f"Registered hardware status callback ({len(self.hardware_status_callbacks)} total)")
 
     async def notify_hardware_status_change(self, component: str, status: dict):
-        """Notify all callbacks of hardware status change"""
-        if not hasattr(self, 'hardware_status_callbacks'):
+        """Notify all callbacks of hardware status change concurrently"""
+        if not getattr(self, 'hardware_status_callbacks', None):
             return
-            
-        for callback in self.hardware_status_callbacks:
+
+        async def run_callback(callback):
+            # Guard each callback on its own - sync or failing callbacks
+            # must not stop the others
             try:
-                await callback(component, status)
+                result = callback(component, status)
+                if asyncio.iscoroutine(result) or isinstance(result, asyncio.Future):
+                    await result
             except Exception as e:
                 logger.error(f"Hardware status callback error: {e}")
+
+        await asyncio.gather(*(run_callback(cb) for cb in list(self.hardware_status_callbacks)))
     
     # ==================== CLEANUP ====================
     
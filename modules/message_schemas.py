@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Inbound message schemas for the DroidDeck WebSocket protocol.
+
+The motion commands (servo, NEMA) are described as msgspec Structs so
+the types of their fields are checked in one C-level pass before the handler runs. A
+position sent as a string is rejected up front instead of reaching the
+hardware service. Every field is optional here: missing fields are left
+to the handlers, which report them with their own error messages.
+Message types without a schema, or a backend without msgspec installed,
+skip validation and rely on the handlers' own checks.
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# msgspec is optional - without it handlers validate their own fields
+MSGSPEC_AVAILABLE = False
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    logger.info("msgspec not available - inbound messages validated by handlers only")
+
+
+if MSGSPEC_AVAILABLE:
+
+    # gc=False: the converted Struct is discarded straight away, so skip
+    # registering it with the cyclic garbage collector
+
+    class ServoCommand(msgspec.Struct, gc=False):
+        channel: Optional[str] = None
+        pos: Optional[float] = None
+        priority: str = "normal"
+
+    class ServoSpeedCommand(msgspec.Struct, gc=False):
+        channel: Optional[str] = None
+        speed: Optional[float] = None
+
+    class ServoAccelerationCommand(msgspec.Struct, gc=False):
+        channel: Optional[str] = None
+        acceleration: Optional[float] = None
+
+    class NemaMoveCommand(msgspec.Struct, gc=False):
+        position_cm: Optional[float] = None
+
+    class NemaSweepCommand(msgspec.Struct, gc=False):
+        min_cm: Optional[float] = None
+        max_cm: Optional[float] = None
+
+    class NemaConfigCommand(msgspec.Struct, gc=False):
+        config: Optional[Dict[str, Any]] = None
+
+    # Message type -> schema. Unknown fields (including "type") are ignored.
+    MESSAGE_SCHEMAS: Dict[str, Any] = {
+        "servo": ServoCommand,
+        "servo_speed": ServoSpeedCommand,
+        "servo_acceleration": ServoAccelerationCommand,
+        "nema_move_to_position": NemaMoveCommand,
+        "nema_start_sweep": NemaSweepCommand,
+        "nema_config_update": NemaConfigCommand,
+    }
+else:
+    MESSAGE_SCHEMAS = {}
+
+
+def validate_message(msg_type: str, data: Dict[str, Any]) -> Optional[str]:
+    """
+    Check a decoded message against its schema.
+
+    Returns:
+        Optional[str]: None if the message is valid or has no schema,
+        otherwise a description of the first validation error
+    """
+    schema = MESSAGE_SCHEMAS.get(msg_type)
+    if schema is None:
+        return None
+    try:
+        msgspec.convert(data, type=schema)
+    except msgspec.ValidationError as e:
+        return str(e)
+    return None
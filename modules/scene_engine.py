@@ -83,6 +83,8 @@ class EnhancedSceneEngine:
         
         # Scene data
         self.scenes = {}
+        # (scenes dict, frontend list) - see get_scenes_list / _invalidate_scenes_list
+        self._scenes_list_cache = None
         self.scene_history = []  # Track recently played scenes
         self.current_scene = None
         self.scene_playing = False
@@ -1148,11 +1150,22 @@ class EnhancedSceneEngine:
     # ==================== SCENE QUERY AND MANAGEMENT ====================
     
     async def get_scenes_list(self) -> List[Dict[str, Any]]:
-        """Get list of available scenes for frontend"""
+        """Get list of available scenes for frontend
+
+        The built and sorted list is cached against the scenes dict it came
+        from. Replacing self.scenes invalidates it implicitly; in-place
+        changes must go through engine methods (e.g. delete_scene) that call
+        _invalidate_scenes_list. Each caller gets its own copy.
+        """
         try:
+            scenes = self.scenes
+            cached = self._scenes_list_cache
+            if cached is not None and cached[0] is scenes:
+                return [dict(scene_info) for scene_info in cached[1]]
+
             scenes_list = []
             
-            for name, scene in self.scenes.items():
+            for name, scene in scenes.items():
                 scene_info = {
                     "label": scene.get("label", name),
                     "emoji": scene.get("emoji", "🎭"),
@@ -1173,12 +1186,30 @@ class EnhancedSceneEngine:
             # Sort by categories and then by label
             scenes_list.sort(key=lambda x: (x["categories"][0] if x["categories"] else "ZZZ", x["label"]))
             
-            return scenes_list
+            self._scenes_list_cache = (scenes, scenes_list)
+            return [dict(scene_info) for scene_info in scenes_list]
             
         except Exception as e:
             logger.error(f"❌ Failed to get scenes list: {e}")
             return []
     
+    def _invalidate_scenes_list(self):
+        """Drop the cached frontend scene list after an in-place scenes change"""
+        self._scenes_list_cache = None
+
+    def delete_scene(self, scene_name: str) -> bool:
+        """
+        Remove a scene from the loaded scenes.
+
+        Returns:
+            bool: True if the scene existed and was removed
+        """
+        if scene_name not in self.scenes:
+            return False
+        del self.scenes[scene_name]
+        self._invalidate_scenes_list()
+        return True
+
     def get_scenes_by_category(self, category: str) -> List[Dict[str, Any]]:
         """Get scenes filtered by category"""
         try:
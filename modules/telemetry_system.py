@@ -14,6 +14,7 @@ import time
 import psutil
 import random
 import math
+import sys
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, Callable, List, Tuple
 from collections import deque
@@ -42,7 +43,13 @@ try:
 except ImportError:
     logger.warning("RPi.GPIO not available - GPIO features disabled")
 
-@dataclass
+# Readings and alerts are slotted where the interpreter supports it
+# (dataclass slots=True needs Python 3.10+). reading_history keeps up to
+# history_size of these, so dropping the per-instance __dict__ roughly
+# halves the history's memory and makes attribute reads slot loads.
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class TelemetryReading:
     """Individual telemetry reading with timestamp"""
     timestamp: float
@@ -69,7 +76,7 @@ class TelemetryReading:
     stream_resolution: str = "0x0"
     stream_latency: float = 0.0
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TelemetryAlert:
     """Telemetry alert/warning definition"""
     name: str
@@ -1090,12 +1097,21 @@ class SafeTelemetrySystem:
         self.hardware_status_callbacks.append(callback)
 
     async def broadcast_hardware_status(self, status: Dict[str, Any]):
-        """Broadcast hardware status to registered callbacks"""
-        for callback in self.hardware_status_callbacks:
+        """Broadcast hardware status to registered callbacks concurrently"""
+        if not self.hardware_status_callbacks:
+            return
+
+        async def run_callback(callback):
+            # Guard each callback on its own - sync or failing callbacks
+            # must not stop the others
             try:
-                await callback(status)
+                result = callback(status)
+                if asyncio.iscoroutine(result) or isinstance(result, asyncio.Future):
+                    await result
             except Exception as e:
-                logger.error(f"Hardware status callback error: {e}")
+                logger.error(f"Hardware status callback error in {callback}: {e}")
+
+        await asyncio.gather(*(run_callback(cb) for cb in list(self.hardware_status_callbacks)))
 
     def calibrate_sensors(self, calibration_data: Dict[str, float]) -> bool:
         """
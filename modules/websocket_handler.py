@@ -6,22 +6,311 @@ Handles all WebSocket message routing and processing
 """
 
 import asyncio
+import functools
 import json
 import logging
 import time
 import os
+import socket
+import sys
+import threading
+from contextvars import ContextVar, copy_context
+from operator import itemgetter
 from typing import Dict, Any, Optional, Callable
 
+import requests
+
 from modules.config_store import ConfigStore
 from modules.file_utils import save_json_atomic
+from modules.message_schemas import validate_message
+from modules.wire_codec import (
+    decode_message, encode_message, encode_json, is_binary_frame, DecodeError,
+    MSGPACK_AVAILABLE, WIRE_JSON, WIRE_MSGPACK
+)
 
 logger = logging.getLogger(__name__)
 
+# Wall-clock time of the message currently being dispatched. handle_message
+# sets it once so every response built while handling that message shares
+# a single time.time() call. It is unset in hardware thread callbacks and
+# in background tasks (see _create_background_task). Replies sent after a
+# long hardware await (homing, moves, scene tests) read the clock instead.
+_dispatch_time: ContextVar[Optional[float]] = ContextVar("_dispatch_time", default=None)
+_dispatch_time_get = _dispatch_time.get
+_wall_time = time.time
+
+
+# Strong references to fire-and-forget tasks - the loop only keeps weak
+# ones, so an unreferenced task can be garbage collected mid-flight
+_background_tasks = set()
+
+
+def _background_task_done(task: asyncio.Task):
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Background task failed: {task.exception()}")
+
+
+def _create_background_task(coro) -> asyncio.Task:
+    """create_task with the dispatch timestamp cleared in the task's context.
+
+    Tasks copy the current context when created, so one spawned while a
+    message is being dispatched would otherwise see that message's
+    timestamp from _now() for as long as it runs. The task is held in
+    _background_tasks until it finishes and any failure is logged.
+    """
+    context = copy_context()
+    context.run(_dispatch_time.set, None)
+    task = context.run(asyncio.create_task, coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_task_done)
+    return task
+
+# Required-field extractors for the servo and NEMA command handlers.
+# itemgetter pulls every key in one C call; KeyError means a field is missing.
+_servo_position_fields = itemgetter("channel", "pos")
+_servo_speed_fields = itemgetter("channel", "speed")
+_servo_acceleration_fields = itemgetter("channel", "acceleration")
+_nema_sweep_fields = itemgetter("min_cm", "max_cm")
+
+# The Steam Deck streams controller state at 50Hz - by far the most common
+# message. handle_message checks for it by identity before the table lookup.
+_intern = sys.intern
+_STEAMDECK_CONTROLLER = _intern("steamdeck_controller")
+
+# Heartbeat text frames that open with their type (JSON.stringify and
+# json.dumps spacing) are answered without running the JSON parser
+_HEARTBEAT_JSON_PREFIXES = (
+    '{"type":"heartbeat",', '{"type":"heartbeat"}',
+    '{"type": "heartbeat",', '{"type": "heartbeat"}',
+)
+
+# Actions accepted by the navigation handler
+_VALID_NAV_ACTIONS = frozenset(('up', 'down', 'left', 'right', 'select', 'exit'))
+
+# Frames larger than this (e.g. save_scenes with a full scene list) are
+# decoded in the thread executor so the parse cannot stall the event loop
+LARGE_FRAME_BYTES = 64 * 1024
+
+# Direct sends (connections without a writer queue) that take longer than
+# this are abandoned so one stalled client cannot hold up a broadcast
+DIRECT_SEND_TIMEOUT = 5.0
+
+# Fixed head of every error response - only the message and timestamp vary
+_ERROR_JSON_PREFIX = '{"type":"error","message":'
+
+# '{"type":"<type>","success":' heads for _send_ack, built on first use per type
+_ACK_JSON_PREFIXES: Dict[str, str] = {}
+
+# Broadcasts queued with _queue_broadcast within this window collapse into
+# a single send of the latest message per key (e.g. NEMA slider drags)
+BROADCAST_COALESCE_WINDOW = 0.02
+
+# Queued events (gesture, tracking) are flushed early once this many are
+# waiting, bounding both the batch frame size and the added latency
+MAX_EVENT_BATCH = 128
+
+# Head of a JSON batch envelope. A writer merging a burst of queued JSON
+# frames for a batch client wraps at most MAX_MERGED_FRAMES per envelope;
+# frames that already are batch envelopes (either encoder's spacing) are
+# sent as-is rather than nested.
+_BATCH_JSON_HEAD = '{"type":"batch","messages":['
+_BATCH_JSON_PREFIXES = ('{"type":"batch"', '{"type": "batch"')
+MAX_MERGED_FRAMES = 64
+
+
+def _merge_json_frames(frames: list) -> str:
+    """Wrap already-encoded JSON frames in a single batch envelope"""
+    if len(frames) == 1:
+        return frames[0]
+    return f"{_BATCH_JSON_HEAD}{','.join(frames)}]}}"
+
+
+def ws_errors(prefix: str):
+    """
+    Decorator for message handlers whose failures are reported to the client.
+
+    Any exception raised by the handler is logged and sent back to the
+    requesting websocket as an error response prefixed with ``prefix``.
+    """
+    def decorator(handler):
+        @functools.wraps(handler)
+        async def wrapper(self, websocket, data: Dict[str, Any]):
+            try:
+                return await handler(self, websocket, data)
+            except Exception as e:
+                logger.error(f"{prefix}: {e}")
+                await self._send_error_response(websocket, f"{prefix}: {str(e)}")
+        return wrapper
+    return decorator
+
+
+class ConnectionWriter:
+    """
+    Per-connection outbound queue drained by a background writer task.
+
+    Handlers and broadcasts append encoded frames without awaiting the
+    socket, so a slow client never stalls request processing. Frames are
+    sent in order. The queue is bounded: a client that falls max_queue
+    frames behind is closed rather than buffered without limit.
+
+    When a burst of frames is waiting, the socket is corked (TCP_CORK,
+    Linux only) while they are written so they leave in as few TCP
+    segments as possible, then uncorked to flush immediately. For clients
+    that accept batch frames (merge_json), consecutive JSON text frames in
+    a burst are folded into one {"type": "batch"} frame as well.
+    """
+
+    def __init__(self, websocket, max_queue: int = 256):
+        self.websocket = websocket
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.closed = False
+        self.merge_json = False
+        self._sock = None
+        if hasattr(socket, "TCP_CORK"):
+            transport = getattr(websocket, "transport", None)
+            self._sock = transport.get_extra_info("socket") if transport else None
+        self.task = asyncio.create_task(self._run())
+
+    def send_nowait(self, frame):
+        """Queue an encoded frame for sending"""
+        if self.closed:
+            return
+        try:
+            self.queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            logger.warning(f"Client send queue full ({self.queue.maxsize} frames) - closing slow connection")
+            self.close()
+            _create_background_task(self.websocket.close(code=1013, reason="send queue overflow"))
+
+    async def _run(self):
+        queue = self.queue
+        send = self.websocket.send
+        try:
+            while True:
+                frame = await queue.get()
+                if queue.empty():
+                    await send(frame)
+                    continue
+                # A burst is queued - cork, write it all, then uncork to flush
+                self._set_cork(1)
+                try:
+                    if self.merge_json:
+                        await self._send_merged(frame)
+                    else:
+                        await send(frame)
+                        while not queue.empty():
+                            await send(queue.get_nowait())
+                finally:
+                    self._set_cork(0)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug("Connection writer stopped: %s", e)
+        finally:
+            self.closed = True
+
+    async def _send_merged(self, frame):
+        """Send a queued burst, folding runs of JSON text frames into batch frames"""
+        queue = self.queue
+        send = self.websocket.send
+        run = []
+        while True:
+            if isinstance(frame, str) and not frame.startswith(_BATCH_JSON_PREFIXES):
+                run.append(frame)
+                if len(run) == MAX_MERGED_FRAMES:
+                    await send(_merge_json_frames(run))
+                    run = []
+            else:
+                # Binary or already-batched frame - flush the run first to keep order
+                if run:
+                    await send(_merge_json_frames(run))
+                    run = []
+                await send(frame)
+            if queue.empty():
+                break
+            frame = queue.get_nowait()
+        if run:
+            await send(_merge_json_frames(run))
+
+    def _set_cork(self, value: int):
+        sock = self._sock
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, value)
+        except OSError:
+            # Socket already gone or not TCP - stop trying
+            self._sock = None
+
+    def close(self):
+        """Stop the writer task and drop any queued frames"""
+        self.closed = True
+        self.task.cancel()
+
 class WebSocketMessageHandler:
     """
     Centralized WebSocket message handler for WALL-E system.
     Routes messages to appropriate handlers based on message type.
     """
+
+    # Fixed attribute layout - skips the instance __dict__ on the hot path
+    __slots__ = (
+        "hardware_service", "scene_engine", "audio_controller", "telemetry_system",
+        "backend", "controller_input_processor", "last_navigation_time",
+        "navigation_cooldown", "_imu_active", "_prev_buttons", "_wire_formats",
+        "_batch_clients", "_writers", "_loop", "config_store",
+        "_static_json_prefixes", "handlers", "_route",
+        "_pending_broadcasts", "_pending_events", "_broadcast_flush",
+        "_scene_trigger", "_pending_scene", "_scene_worker", "_last_tracking_state",
+        "_error_buf", "_handler_stats", "_set_failsafe",
+        "_mode_handlers", "_constant_frames", "_bt",
+        # Assigned by the backend after construction
+        "camera_proxy_url",
+        # Serial throughput sampling in _handle_system_status_request
+        "_mixer_stat_time", "_mixer_stat_ticks", "_mixer_stat_cmds",
+    )
+
+    # Responses whose content never changes apart from the timestamp. Their
+    # JSON is serialized once at init and only the timestamp is spliced in
+    # per send - see _send_static_response.
+    STATIC_RESPONSES = {
+        "heartbeat_response": {"type": "heartbeat_response"},
+        "servo_config_updated": {"type": "servo_config_updated", "success": True},
+        "nema_sweep_stopped": {"type": "nema_sweep_stopped", "success": True},
+        "gesture_stats": {
+            "type": "gesture_stats",
+            "supported_gestures": ["left_wave", "right_wave", "hands_up"],
+            "scene_mappings": {
+                "left_wave": "left_wave_response",
+                "right_wave": "right_wave_response",
+                "hands_up": "hands_up_response"
+            },
+            "detection_enabled": True,  # This would come from system state
+        },
+    }
+    
+    # Responses with no variable fields at all - each is encoded once per wire
+    # format on first use and the cached frame resent - see _send_constant_response
+    CONSTANT_RESPONSES = {
+        "calibration_mode_started": {
+            "type": "calibration_mode_started",
+            "success": True,
+            "message": "Calibration streaming enabled"
+        },
+        "calibration_mode_stopped": {
+            "type": "calibration_mode_stopped",
+            "success": True,
+            "message": "Calibration streaming disabled"
+        },
+    }
+
+    # Gesture name -> scene played when it is detected
+    GESTURE_SCENES = {
+        "left_wave": "left hand wave",
+        "right_wave": "right hand wave",
+        "hands_up": "hands up",
+    }
     
     def __init__(self, hardware_service, scene_engine, audio_controller, telemetry_system, backend_ref, controller_input_processor=None):
         self.hardware_service = hardware_service
@@ -30,11 +319,39 @@ class WebSocketMessageHandler:
         self.telemetry_system = telemetry_system
         self.backend = backend_ref  # Reference to main backend for broadcasting
         self.controller_input_processor = controller_input_processor  # For reloading servo home positions
+        # Backend capability probed once, not on every failsafe toggle
+        self._set_failsafe: Optional[Callable] = getattr(backend_ref, 'set_failsafe_mode', None)
+        self.camera_proxy_url = getattr(backend_ref, 'camera_proxy_url', 'http://10.1.1.230:8081')
+        # The backend creates its Bluetooth controller after this handler - see _bluetooth
+        self._bt = None
         self.last_navigation_time = 0
         self.navigation_cooldown = 0.3  # debounce navigation commands
         self._imu_active = False  # tracks whether frontend is streaming IMU data
         self._prev_buttons: Dict[str, bool] = {}  # last seen button state for delta filtering
+        self._wire_formats: Dict[Any, str] = {}  # websocket -> negotiated wire format (JSON if absent)
+        self._batch_clients = set()  # websockets that accept {"type": "batch"} frames
+        self._writers: Dict[Any, ConnectionWriter] = {}  # websocket -> outbound queue
+        self._loop: Optional[asyncio.AbstractEventLoop] = None  # cached on first use, see _get_loop
+        self._pending_broadcasts: Dict[str, dict] = {}  # coalescing key -> latest queued broadcast
+        self._pending_events: list = []  # queued event broadcasts, all delivered in order
+        self._broadcast_flush: Optional[asyncio.Task] = None
+        # Gesture scenes are handed to a worker task - see _trigger_gesture_scene.
+        # The Event is created with the worker so it binds to the running loop.
+        self._scene_trigger: Optional[asyncio.Event] = None
+        self._pending_scene: Optional[tuple] = None  # (scene_name, gesture_name)
+        self._scene_worker: Optional[asyncio.Task] = None
+        self._last_tracking_state: Optional[bool] = None  # last tracking state broadcast
+        # Reused for every non-JSON error response - encoding is synchronous,
+        # so no other coroutine can touch it between the fill and the encode
+        self._error_buf: Dict[str, Any] = {"type": "error", "message": "", "timestamp": 0.0}
         self.config_store = ConfigStore()
+        # Cached '{...,"timestamp":' JSON prefixes for STATIC_RESPONSES
+        self._static_json_prefixes = {
+            name: encode_json(template)[:-1] + ',"timestamp":'
+            for name, template in self.STATIC_RESPONSES.items()
+        }
+        # (CONSTANT_RESPONSES name, wire format) -> encoded frame
+        self._constant_frames: Dict[tuple, Any] = {}
         # Message type routing table
         self.handlers = {
             # Servo control
@@ -93,6 +410,9 @@ class WebSocketMessageHandler:
             # Heartbeat
             "heartbeat": self._handle_heartbeat,
 
+            # Wire format negotiation (JSON / MessagePack)
+            "set_wire_format": self._handle_set_wire_format,
+
             # NEMA stepper motor control
             "nema_move_to_position": self._handle_nema_move_to_position,
             "nema_start_sweep": self._handle_nema_start_sweep,
@@ -114,6 +434,31 @@ class WebSocketMessageHandler:
             "server_update": self._handle_server_update,
             "server_rollback": self._handle_server_rollback,
         }
+        # Intern the routing keys so lookups of an interned msg_type hit the
+        # identity fast path in the dict's key comparison
+        self.handlers = {_intern(k): v for k, v in self.handlers.items()}
+        # Bound lookup reused by handle_message on every frame
+        self._route = self.handlers.get
+        # Mode name -> handler for "mode" messages; register new modes here
+        self._mode_handlers: Dict[str, Callable] = {
+            "idle": self._mode_idle,
+            "demo": self._mode_demo,
+        }
+        # The routing table is fixed from here on, so its stats are too
+        self._handler_stats: Dict[str, Any] = {
+            "total_handlers": len(self.handlers),
+            "handler_types": tuple(self.handlers),
+            "categories": {
+                "servo_control": 6,
+                "stepper_motor": 1,
+                "nema_control": 7,  # Add this line
+                "scene_management": 4,
+                "audio_control": 2,
+                "system_control": 3,
+                "gesture_tracking": 2,
+                "utility": 3
+            }
+        }
         
         logger.info(f" WebSocket handler initialized with {len(self.handlers)} message types")
 
@@ -121,28 +466,26 @@ class WebSocketMessageHandler:
     async def _handle_frontend_controller(self, websocket, data: Dict[str, Any]):
         """Handle frontend controller input - same as steamdeck but different source"""
         try:
-            axes = data.get("axes", {})
-            buttons = data.get("buttons", {})
-            timestamp = data.get("timestamp", time.time())
-            
-            # Process through existing controller input processor
-            if hasattr(self.backend, 'controller_input_processor'):
-                # Process all axes
-                for axis_name, axis_value in axes.items():
-                    await self.backend.controller_input_processor.process_controller_input(
-                        control_name=axis_name,
-                        raw_value=axis_value,
-                        input_type="axis"
-                    )
-                # Process all buttons
-                for button_name, button_pressed in buttons.items():
-                    # Convert boolean to float (1.0 or 0.0)
-                    button_value = 1.0 if button_pressed else 0.0
-                    await self.backend.controller_input_processor.process_controller_input(
-                        control_name=button_name,
-                        raw_value=button_value,
-                        input_type="button"
-                    )
+            processor = getattr(self.backend, 'controller_input_processor', None)
+            if processor is None:
+                return
+            # Resolve the processor method once per packet, not once per control
+            process = processor.process_controller_input
+            
+            # Process all axes
+            for axis_name, axis_value in data.get("axes", {}).items():
+                await process(
+                    control_name=axis_name,
+                    raw_value=axis_value,
+                    input_type="axis"
+                )
+            # Process all buttons - pressed state is sent as 1.0 / 0.0
+            for button_name, button_pressed in data.get("buttons", {}).items():
+                await process(
+                    control_name=button_name,
+                    raw_value=1.0 if button_pressed else 0.0,
+                    input_type="button"
+                )
             
         except Exception as e:
             logger.error(f"Frontend controller error: {e}")
@@ -166,14 +509,17 @@ class WebSocketMessageHandler:
                     logger.info("IMU tilt disabled — imu_roll/imu_pitch data stopped")
             
             
-            if not hasattr(self.backend, 'controller_input_processor'):
+            processor = getattr(self.backend, 'controller_input_processor', None)
+            if processor is None:
                 logger.error("ERROR: No controller_input_processor available!")
                 return
+            # Resolve the processor method once per frame, not once per control
+            process = processor.process_controller_input
             
             # Process axes (every frame - analog values need continuous processing)
             for axis_name, axis_value in axes.items():
                 try:
-                    await self.backend.controller_input_processor.process_controller_input(
+                    await process(
                         control_name=axis_name,
                         raw_value=axis_value,
                         input_type="axis"
@@ -186,14 +532,15 @@ class WebSocketMessageHandler:
             # button state at 50Hz; without this filter every idle button is
             # dispatched through the behaviour registry every frame
             # (~1,000 no-op coroutine calls per second).
+            prev_buttons = self._prev_buttons
             for button_name, is_pressed in buttons.items():
-                if self._prev_buttons.get(button_name) == is_pressed:
+                if prev_buttons.get(button_name) == is_pressed:
                     continue
-                self._prev_buttons[button_name] = is_pressed
+                prev_buttons[button_name] = is_pressed
 
                 value = 1.0 if is_pressed else 0.0
                 try:
-                    await self.backend.controller_input_processor.process_controller_input(
+                    await process(
                         control_name=button_name,
                         raw_value=value,
                         input_type="button"
@@ -211,47 +558,92 @@ class WebSocketMessageHandler:
         
         Args:
             websocket: The WebSocket connection
-            message: JSON message string
+            message: JSON text frame, or MessagePack binary frame
             
         Returns:
             bool: True if message was handled successfully
         """
+        if type(message) is str and message.startswith(_HEARTBEAT_JSON_PREFIXES):
+            await self._send_static_response(websocket, "heartbeat_response")
+            return True
+
+        try:
+            # A binary frame is the client's implicit opt-in to MessagePack
+            if MSGPACK_AVAILABLE and is_binary_frame(message):
+                self._wire_formats[websocket] = WIRE_MSGPACK
+            if len(message) > LARGE_FRAME_BYTES:
+                data = await self._get_loop().run_in_executor(None, decode_message, message)
+            else:
+                data = decode_message(message)
+        except DecodeError as e:
+            logger.error(f" Invalid message frame received: {e}")
+            await self._send_error_response(websocket, "Invalid JSON format")
+            return False
+
+        token = _dispatch_time.set(time.time())
         try:
-            data = json.loads(message)
             msg_type = data.get("type")
             
             if not msg_type:
                 logger.warning("Received message without type field")
                 return False
+            if type(msg_type) is str:
+                msg_type = _intern(msg_type)
         
             
+            # Fast path for the 50Hz controller stream
+            if msg_type is _STEAMDECK_CONTROLLER:
+                await self._handle_steamdeck_controller(websocket, data)
+                return True
+            
             # Route to appropriate handler
-            handler = self.handlers.get(msg_type)
+            handler = self._route(msg_type)
             if handler:
+                error = validate_message(msg_type, data)
+                if error:
+                    await self._send_error_response(websocket, f"Invalid {msg_type} message: {error}")
+                    return False
                 await handler(websocket, data)
                 return True
             else:
                 await self._send_error_response(websocket, f"Unknown message type: {msg_type}")
                 return False
                 
-        except json.JSONDecodeError as e:
-            logger.error(f" Invalid JSON received: {e}")
-            await self._send_error_response(websocket, "Invalid JSON format")
-            return False
         except Exception as e:
             logger.error(f" Error handling message: {e}")
             await self._send_error_response(websocket, f"Message handling error: {str(e)}")
             return False
+        finally:
+            _dispatch_time.reset(token)
+
+    def _bluetooth(self):
+        """Return the backend's Bluetooth controller (None if absent), cached once found"""
+        bt = self._bt
+        if bt is None:
+            bt = self._bt = getattr(self.backend, 'bluetooth_controller', None)
+        return bt
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the backend event loop, looked up once and then cached"""
+        loop = self._loop
+        if loop is None:
+            loop = self._loop = asyncio.get_running_loop()
+        return loop
+
+    def _now(self) -> float:
+        """Timestamp of the message being dispatched, or time.time() outside a dispatch"""
+        ts = _dispatch_time_get()
+        return _wall_time() if ts is None else ts
     
     async def _handle_button_debug(self, websocket, data: Dict[str, Any]):
         """Log every button-down edge from the frontend for diagnostics."""
-        logger.info(f"[BTN] Frontend button pressed: {data.get('button')}")
+        logger.info("[BTN] Frontend button pressed: %s", data.get('button'))
 
     async def _handle_imu_toggle_debug(self, websocket, data: Dict[str, Any]):
         """Log the frontend's current imu_toggle_buttons set for debugging."""
         buttons = data.get("buttons", [])
         if buttons:
-            logger.info(f"[IMU] Frontend imu_toggle_buttons: {buttons}")
+            logger.info("[IMU] Frontend imu_toggle_buttons: %s", buttons)
         else:
             logger.warning("[IMU] Frontend imu_toggle_buttons is empty — no toggle button configured")
 
@@ -267,7 +659,7 @@ class WebSocketMessageHandler:
             await self._send_websocket_message(websocket, {
                 "type":      "controller_config_data",
                 "config":    config,
-                "timestamp": time.time()
+                "timestamp": self._now()
             })
             logger.info(f"Sent controller config to client ({len(config)} mappings)")
 
@@ -295,12 +687,10 @@ class WebSocketMessageHandler:
                 else:
                     logger.warning("Failed to reload controller config in processor")
             
-            await self._send_websocket_message(websocket, {
-                "type": "controller_config_saved",
-                "success": True,
-                "message": f"Controller configuration saved with {len(config)} mappings",
-                "timestamp": time.time()
-            })
+            await self._send_ack(
+                websocket, "controller_config_saved", True,
+                f"Controller configuration saved with {len(config)} mappings"
+            )
             
             logger.info(f"Controller configuration saved and reloaded")
             
@@ -319,8 +709,7 @@ class WebSocketMessageHandler:
                 return
             
             # Validate action
-            valid_actions = ['up', 'down', 'left', 'right', 'select', 'exit']
-            if action not in valid_actions:
+            if action not in _VALID_NAV_ACTIONS:
                 await self._send_error_response(websocket, f"Invalid action: {action}")
                 return
             
@@ -328,14 +717,15 @@ class WebSocketMessageHandler:
             navigation_message = {
                 "type": "navigation",
                 "action": action,
-                "timestamp": time.time(),
+                "timestamp": self._now(),
                 "source": "controller"
             }
             
-            # Broadcast to all clients
-            await self.backend.broadcast_message(navigation_message)
+            # Broadcast to all clients - queued in order, so a held stick's
+            # repeats share batch frames with anything else in the window
+            self._queue_event(navigation_message)
             
-            logger.debug(f"Broadcasted navigation command: {action}")
+            logger.debug("Queued navigation command: %s", action)
             
         except Exception as e:
             logger.error(f"Navigation command error: {e}")
@@ -344,18 +734,15 @@ class WebSocketMessageHandler:
     async def _handle_start_calibration_mode(self, websocket, data: Dict[str, Any]):
         """Start controller calibration mode - FIXED for proper streaming"""
         try:
-            if hasattr(self.backend, 'bluetooth_controller'):
+            bt = self._bluetooth()
+            if bt is not None:
                 # Enable calibration streaming
-                self.backend.bluetooth_controller.calibration_streaming = True
+                bt.calibration_streaming = True
                 
-                await self._send_websocket_message(websocket, {
-                    "type": "calibration_mode_started",
-                    "success": True,
-                    "message": "Calibration streaming enabled"
-                })
+                await self._send_constant_response(websocket, "calibration_mode_started")
                 
                 # Send current controller info
-                controller_info = self.backend.bluetooth_controller.get_controller_info()
+                controller_info = bt.get_controller_info()
                 await self._send_websocket_message(websocket, {
                     "type": "controller_info",
                     **controller_info
@@ -372,15 +759,12 @@ class WebSocketMessageHandler:
     async def _handle_stop_calibration_mode(self, websocket, data: Dict[str, Any]):
         """Stop controller calibration mode - FIXED"""
         try:
-            if hasattr(self.backend, 'bluetooth_controller'):
+            bt = self._bluetooth()
+            if bt is not None:
                 # Disable calibration streaming
-                self.backend.bluetooth_controller.calibration_streaming = False
+                bt.calibration_streaming = False
                 
-                await self._send_websocket_message(websocket, {
-                    "type": "calibration_mode_stopped",
-                    "success": True,
-                    "message": "Calibration streaming disabled"
-                })
+                await self._send_constant_response(websocket, "calibration_mode_stopped")
                 
                 logger.info("Calibration mode stopped - streaming disabled")
             else:
@@ -393,39 +777,52 @@ class WebSocketMessageHandler:
     async def _handle_get_controller_status(self, websocket, data: Dict[str, Any]):
         """Get current controller connection status"""
         try:
-            if hasattr(self.backend, 'bluetooth_controller'):
-                controller_info = self.backend.bluetooth_controller.get_controller_info()
-                await self._send_websocket_message(websocket, {
+            bt = self._bluetooth()
+            if bt is not None:
+                controller_info = bt.get_controller_info()
+                # Status and any calibration sample go out together - one
+                # frame for batch-capable clients
+                messages = [{
                     "type": "controller_status",
                     **controller_info
-                })
+                }]
                 
                 # If in calibration mode, also send sample data immediately
-                if self.backend.bluetooth_controller.calibration_streaming:
-                    # Send a sample calibration data packet
-                    if hasattr(self.backend.bluetooth_controller, 'joystick') and self.backend.bluetooth_controller.joystick:
+                if bt.calibration_streaming:
+                    # Reuse the stream loop's latest read when it is fresh -
+                    # no SDL polling on the event loop
+                    snapshot = bt.get_calibration_snapshot()
+                    if snapshot is not None:
+                        messages.append(snapshot)
+                    # Otherwise send a live sample calibration data packet
+                    elif getattr(bt, 'joystick', None):
                         import pygame
                         pygame.event.pump()
                         
+                        js = bt.joystick
+                        get_axis = js.get_axis
+                        num_axes = js.get_numaxes()
                         sample_data = {
                             "type": "calibration_data",
-                            "left_stick_x": self.backend.bluetooth_controller.joystick.get_axis(0) if self.backend.bluetooth_controller.joystick.get_numaxes() > 0 else 0.0,
-                            "left_stick_y": -self.backend.bluetooth_controller.joystick.get_axis(1) if self.backend.bluetooth_controller.joystick.get_numaxes() > 1 else 0.0,
-                            "right_stick_x": self.backend.bluetooth_controller.joystick.get_axis(2) if self.backend.bluetooth_controller.joystick.get_numaxes() > 2 else 0.0,
-                            "right_stick_y": -self.backend.bluetooth_controller.joystick.get_axis(3) if self.backend.bluetooth_controller.joystick.get_numaxes() > 3 else 0.0,
-                            "left_trigger": max(0, self.backend.bluetooth_controller.joystick.get_axis(4)) if self.backend.bluetooth_controller.joystick.get_numaxes() > 4 else 0.0,
-                            "right_trigger": max(0, self.backend.bluetooth_controller.joystick.get_axis(5)) if self.backend.bluetooth_controller.joystick.get_numaxes() > 5 else 0.0,
-                            "timestamp": time.time()
+                            "left_stick_x": get_axis(0) if num_axes > 0 else 0.0,
+                            "left_stick_y": -get_axis(1) if num_axes > 1 else 0.0,
+                            "right_stick_x": get_axis(2) if num_axes > 2 else 0.0,
+                            "right_stick_y": -get_axis(3) if num_axes > 3 else 0.0,
+                            "left_trigger": max(0, get_axis(4)) if num_axes > 4 else 0.0,
+                            "right_trigger": max(0, get_axis(5)) if num_axes > 5 else 0.0,
+                            "timestamp": self._now()
                         }
                         
                         # Add button states
-                        for button_id in range(self.backend.bluetooth_controller.joystick.get_numbuttons()):
-                            button_name = self.backend.bluetooth_controller.button_map.get(button_id, f"button_{button_id}")
-                            sample_data[button_name] = bool(self.backend.bluetooth_controller.joystick.get_button(button_id))
+                        get_button = js.get_button
+                        button_map_get = bt.button_map.get
+                        for button_id in range(js.get_numbuttons()):
+                            button_name = button_map_get(button_id, f"button_{button_id}")
+                            sample_data[button_name] = bool(get_button(button_id))
                         
                         # Add D-pad states
-                        if self.backend.bluetooth_controller.joystick.get_numhats() > 0:
-                            hat_x, hat_y = self.backend.bluetooth_controller.joystick.get_hat(0)
+                        if js.get_numhats() > 0:
+                            hat_x, hat_y = js.get_hat(0)
                             sample_data.update({
                                 "dpad_up": hat_y > 0,
                                 "dpad_down": hat_y < 0,
@@ -433,7 +830,9 @@ class WebSocketMessageHandler:
                                 "dpad_right": hat_x > 0,
                             })
                         
-                        await self._send_websocket_message(websocket, sample_data)
+                        messages.append(sample_data)
+                
+                await self._send_batch(websocket, messages)
                         
             else:
                 await self._send_websocket_message(websocket, {
@@ -448,13 +847,14 @@ class WebSocketMessageHandler:
     async def _handle_save_calibration(self, websocket, data: Dict[str, Any]):
         """Save calibration data from frontend wizard"""
         try:
-            if hasattr(self.backend, 'bluetooth_controller'):
+            bt = self._bluetooth()
+            if bt is not None:
                 calibration_data = data.get('calibration', {})
                 
                 logger.info(f"Received calibration data: {calibration_data}")
                 
                 # Use the optimized save method
-                success = await self.backend.bluetooth_controller.save_calibration(calibration_data)
+                success = await bt.save_calibration(calibration_data)
                 
                 if success:
                     await self._send_websocket_message(websocket, {
@@ -467,7 +867,7 @@ class WebSocketMessageHandler:
                     await self.backend.broadcast_message({
                         "type": "calibration_updated",
                         "calibrated": True,
-                        "timestamp": time.time()
+                        "timestamp": self._now()
                     })
                     
                     logger.info("Controller calibration saved and broadcasted")
@@ -483,8 +883,9 @@ class WebSocketMessageHandler:
     async def _handle_controller_calibration(self, websocket, data: Dict[str, Any]):
         """Handle automatic controller calibration request"""
         try:
-            if hasattr(self.backend, 'bluetooth_controller'):
-                success = await self.backend.bluetooth_controller.perform_startup_calibration()
+            bt = self._bluetooth()
+            if bt is not None:
+                success = await bt.perform_startup_calibration()
                 await self._send_websocket_message(websocket, {
                     "type": "controller_calibration_result",
                     "success": success,
@@ -499,8 +900,9 @@ class WebSocketMessageHandler:
     async def _handle_manual_controller_calibration(self, websocket, data: Dict[str, Any]):
         """Handle manual controller calibration request"""
         try:
-            if hasattr(self.backend, 'bluetooth_controller'):
-                success = await self.backend.bluetooth_controller.manual_calibration_sequence()
+            bt = self._bluetooth()
+            if bt is not None:
+                success = await bt.manual_calibration_sequence()
                 await self._send_websocket_message(websocket, {
                     "type": "manual_calibration_result",
                     "success": success,
@@ -517,8 +919,10 @@ class WebSocketMessageHandler:
     
     async def _handle_servo_command(self, websocket, data: Dict[str, Any]):
         """Handle servo position command"""
-        channel_key = data.get("channel")
-        position = data.get("pos")
+        try:
+            channel_key, position = _servo_position_fields(data)
+        except KeyError:
+            channel_key = position = None
         priority_str = data.get("priority", "normal")
         
         if not channel_key or position is None:
@@ -534,8 +938,10 @@ class WebSocketMessageHandler:
     
     async def _handle_servo_speed_command(self, websocket, data: Dict[str, Any]):
         """Handle servo speed setting command"""
-        channel_key = data.get("channel")
-        speed = data.get("speed")
+        try:
+            channel_key, speed = _servo_speed_fields(data)
+        except KeyError:
+            channel_key = speed = None
         
         if not channel_key or speed is None:
             await self._send_error_response(websocket, "Missing channel or speed")
@@ -547,8 +953,10 @@ class WebSocketMessageHandler:
     
     async def _handle_servo_acceleration_command(self, websocket, data: Dict[str, Any]):
         """Handle servo acceleration setting command"""
-        channel_key = data.get("channel")
-        acceleration = data.get("acceleration")
+        try:
+            channel_key, acceleration = _servo_acceleration_fields(data)
+        except KeyError:
+            channel_key = acceleration = None
         
         if not channel_key or acceleration is None:
             await self._send_error_response(websocket, "Missing channel or acceleration")
@@ -563,13 +971,14 @@ class WebSocketMessageHandler:
         try:
             controller_info = {}
             
-            if hasattr(self.backend, 'bluetooth_controller'):
-                controller_info = self.backend.bluetooth_controller.get_controller_info()
+            bt = self._bluetooth()
+            if bt is not None:
+                controller_info = bt.get_controller_info()
             
             await self._send_websocket_message(websocket, {
                 "type": "controller_info",
                 "controller_info": controller_info,
-                "timestamp": time.time()
+                "timestamp": self._now()
             })
             
         except Exception as e:
@@ -578,32 +987,6 @@ class WebSocketMessageHandler:
 
 
 
-    async def _handle_get_servo_position(self, websocket, data: Dict[str, Any]):
-        """Handle servo position request"""
-        channel_key = data.get("channel")
-        
-        if not channel_key:
-            await self._send_error_response(websocket, "Missing channel")
-            return
-        
-        # Use callback to send position when received
-        def position_callback(position):
-            response = {
-                "type": "servo_position",
-                "channel": channel_key,
-                "position": position,
-                "timestamp": time.time()
-            }
-            # Schedule response in main event loop
-            asyncio.run_coroutine_threadsafe(
-                self._send_websocket_message(websocket, response),
-                asyncio.get_running_loop()
-            )
-        
-        success = await self.hardware_service.get_servo_position(channel_key, position_callback)
-        if not success:
-            await self._send_error_response(websocket, f"Failed to request position for {channel_key}")
-
     async def _handle_servo_config_update(self, websocket, data: Dict[str, Any]):
         """Handle servo configuration update"""
         config = data.get("config")
@@ -613,11 +996,7 @@ class WebSocketMessageHandler:
             return
         
         # Just acknowledge - the actual servo commands were already sent
-        await self._send_websocket_message(websocket, {
-            "type": "servo_config_updated", 
-            "success": True,
-            "timestamp": time.time()
-        })
+        await self._send_static_response(websocket, "servo_config_updated")
         
         logger.info(f"Servo configuration updated")
 
@@ -630,7 +1009,7 @@ class WebSocketMessageHandler:
         home_positions = {int(k): v for k, v in home_positions.items()}
         
         logger.info(f"Received home positions update for Maestro {maestro}: {len(home_positions)} channels")
-        logger.debug(f"Home positions data: {home_positions}")
+        logger.debug("Home positions data: %s", home_positions)
         
         # Update backend controller_config.json with center_offset values
         try:
@@ -643,7 +1022,10 @@ class WebSocketMessageHandler:
             
             # Update center_offset for any joystick mappings that target these servos
             updated_count = 0
-            logger.debug(f"Checking {len(controller_config)} controller mappings")
+            # Checked once per request - the loop below is silent unless DEBUG is on
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug("Checking %d controller mappings", len(controller_config))
             
             for control_name, control_config in controller_config.items():
                 behavior = control_config.get('behavior')
@@ -651,10 +1033,12 @@ class WebSocketMessageHandler:
                 # Handle direct_servo behavior
                 if behavior == 'direct_servo':
                     target = control_config.get('target')
-                    logger.debug(f"Checking {control_name}: target={target}, maestro={maestro}")
+                    if debug:
+                        logger.debug("Checking %s: target=%s, maestro=%s", control_name, target, maestro)
                     if target and target.startswith(f"m{maestro}_ch"):
                         channel_num = int(target.split("_ch")[1])
-                        logger.debug(f" Channel {channel_num}, checking if in home_positions: {channel_num in home_positions}")
+                        if debug:
+                            logger.debug(" Channel %s, checking if in home_positions: %s", channel_num, channel_num in home_positions)
                         if channel_num in home_positions:
                             home_pos = home_positions[channel_num]
                             center_offset = home_pos - 1500
@@ -711,7 +1095,7 @@ class WebSocketMessageHandler:
                 "success": True,
                 "maestro": maestro,
                 "updated_count": updated_count,
-                "timestamp": time.time()
+                "timestamp": self._now()
             })
             
         except Exception as e:
@@ -727,7 +1111,7 @@ class WebSocketMessageHandler:
         channels = {int(k): v for k, v in channels.items()}
         
         logger.info(f"[SERVO] Received settings save for Maestro {maestro}: {len(channels)} channels")
-        logger.debug(f"Settings data: {channels}")
+        logger.debug("Settings data: %s", channels)
         
         try:
             # Load servo_config.json
@@ -834,7 +1218,7 @@ class WebSocketMessageHandler:
                 "success": True,
                 "maestro": maestro,
                 "channels_updated": updated_count,
-                "timestamp": time.time()
+                "timestamp": self._now()
             })
             
         except Exception as e:
@@ -873,249 +1257,213 @@ class WebSocketMessageHandler:
                 "type": "servo_config_response",
                 "maestro": maestro,
                 "config": maestro_config,
-                "timestamp": time.time()
+                "timestamp": self._now()
             })
             
         except Exception as e:
             logger.error(f"Failed to send servo config: {e}")
             await self._send_error_response(websocket, f"Failed to load config: {str(e)}")
 
+    @ws_errors("NEMA move error")
     async def _handle_nema_move_to_position(self, websocket, data: Dict[str, Any]):
         """Handle NEMA move to position command"""
-        try:
-            position_cm = data.get("position_cm")
-            
-            if position_cm is None:
-                await self._send_error_response(websocket, "Missing position_cm parameter")
-                return
-            
-            # Create stepper command
-            stepper_data = {
-                "command": "move_to_position",
-                "position_cm": position_cm
-            }
-            
-            response = await self.hardware_service.handle_stepper_command(stepper_data)
-            
-            # Send response back to client
-            await self._send_websocket_message(websocket, {
-                "type": "nema_move_response",
-                "success": response.get("success", False),
-                "message": response.get("message", ""),
+        position_cm = data.get("position_cm")
+        
+        if position_cm is None:
+            await self._send_error_response(websocket, "Missing position_cm parameter")
+            return
+        
+        # Create stepper command
+        stepper_data = {
+            "command": "move_to_position",
+            "position_cm": position_cm
+        }
+        
+        response = await self.hardware_service.handle_stepper_command(stepper_data)
+        # The move can take seconds - stamp its completion, not the request
+        now = time.time()
+        
+        await self._send_ack(
+            websocket, "nema_move_response", response.get("success", False),
+            response.get("message", ""), timestamp=now, position_cm=position_cm
+        )
+        
+        # If successful, broadcast position update to all clients - coalesced,
+        # so a burst of moves from a slider drag sends only the final position
+        if response.get("success"):
+            self._queue_broadcast("nema_position_update", {
+                "type": "nema_position_update",
                 "position_cm": position_cm,
-                "timestamp": time.time()
+                "timestamp": now
             })
-            
-            # If successful, broadcast position update to all clients
-            if response.get("success"):
-                await self.backend.broadcast_message({
-                    "type": "nema_position_update",
-                    "position_cm": position_cm,
-                    "timestamp": time.time()
-                })
-            
-        except Exception as e:
-            logger.error(f"NEMA move position error: {e}")
-            await self._send_error_response(websocket, f"NEMA move error: {str(e)}")
 
+    @ws_errors("NEMA sweep error")
     async def _handle_nema_start_sweep(self, websocket, data: Dict[str, Any]):
         """Handle NEMA start sweep command"""
         try:
-            min_cm = data.get("min_cm")
-            max_cm = data.get("max_cm")
-            acceleration = data.get("acceleration", 800)
-            normal_speed = data.get("normal_speed", 800)
-            
-            if min_cm is None or max_cm is None:
-                await self._send_error_response(websocket, "Missing min_cm or max_cm parameters")
-                return
-            
-            # Validate sweep parameters
-            if min_cm >= max_cm:
-                await self._send_error_response(websocket, "Invalid sweep range: min_cm must be less than max_cm")
-                return
-            
-            # Start the actual sweep via hardware service
-            logger.info(f"NEMA sweep started: {min_cm} to {max_cm} cm")
-            
-            # Send command to hardware service to start sweeping
-            sweep_response = await self.hardware_service.handle_stepper_command({
-                "command": "start_sweep",
-                "min_cm": min_cm,
-                "max_cm": max_cm
-            })
-            
-            if not sweep_response.get("success", False):
-                await self._send_error_response(websocket, f"Failed to start sweep: {sweep_response.get('message', 'Unknown error')}")
-                return
-            
-            # Broadcast sweep status
-            await self.backend.broadcast_message({
-                "type": "nema_sweep_status",
-                "sweeping": True,
-                "min_cm": min_cm,
-                "max_cm": max_cm,
-                "timestamp": time.time()
-            })
-            
-            await self._send_websocket_message(websocket, {
-                "type": "nema_sweep_started",
-                "success": True,
-                "min_cm": min_cm,
-                "max_cm": max_cm,
-                "timestamp": time.time()
-            })
-            
-        except Exception as e:
-            logger.error(f"NEMA start sweep error: {e}")
-            await self._send_error_response(websocket, f"NEMA sweep error: {str(e)}")
+            min_cm, max_cm = _nema_sweep_fields(data)
+        except KeyError:
+            min_cm = max_cm = None
+        
+        if min_cm is None or max_cm is None:
+            await self._send_error_response(websocket, "Missing min_cm or max_cm parameters")
+            return
+        
+        # Validate sweep parameters
+        if min_cm >= max_cm:
+            await self._send_error_response(websocket, "Invalid sweep range: min_cm must be less than max_cm")
+            return
+        
+        # Start the actual sweep via hardware service
+        logger.info("NEMA sweep started: %s to %s cm", min_cm, max_cm)
+        
+        # Send command to hardware service to start sweeping
+        sweep_response = await self.hardware_service.handle_stepper_command({
+            "command": "start_sweep",
+            "min_cm": min_cm,
+            "max_cm": max_cm
+        })
+        
+        if not sweep_response.get("success", False):
+            await self._send_error_response(websocket, f"Failed to start sweep: {sweep_response.get('message', 'Unknown error')}")
+            return
+        
+        # Broadcast sweep status
+        await self.backend.broadcast_message({
+            "type": "nema_sweep_status",
+            "sweeping": True,
+            "min_cm": min_cm,
+            "max_cm": max_cm,
+            "timestamp": self._now()
+        })
+        
+        await self._send_websocket_message(websocket, {
+            "type": "nema_sweep_started",
+            "success": True,
+            "min_cm": min_cm,
+            "max_cm": max_cm,
+            "timestamp": self._now()
+        })
 
+    @ws_errors("NEMA stop sweep error")
     async def _handle_nema_stop_sweep(self, websocket, data: Dict[str, Any]):
         """Handle NEMA stop sweep command"""
-        try:
-            logger.info("NEMA sweep stopped")
-            
-            # Send stop command to hardware service
-            stop_response = await self.hardware_service.handle_stepper_command({
-                "command": "stop_sweep"
-            })
-            
-            # Broadcast sweep stopped status
-            await self.backend.broadcast_message({
-                "type": "nema_sweep_status",
-                "sweeping": False,
-                "timestamp": time.time()
-            })
-            
-            await self._send_websocket_message(websocket, {
-                "type": "nema_sweep_stopped",
-                "success": True,
-                "timestamp": time.time()
-            })
-            
-        except Exception as e:
-            logger.error(f"NEMA stop sweep error: {e}")
-            await self._send_error_response(websocket, f"NEMA stop sweep error: {str(e)}")
+        logger.info("NEMA sweep stopped")
+        
+        # Send stop command to hardware service
+        stop_response = await self.hardware_service.handle_stepper_command({
+            "command": "stop_sweep"
+        })
+        
+        # Broadcast sweep stopped status
+        await self.backend.broadcast_message({
+            "type": "nema_sweep_status",
+            "sweeping": False,
+            "timestamp": self._now()
+        })
+        
+        await self._send_static_response(websocket, "nema_sweep_stopped")
 
+    @ws_errors("NEMA config error")
     async def _handle_nema_config_update(self, websocket, data: Dict[str, Any]):
         """Handle NEMA configuration update"""
-        try:
-            config = data.get("config")
-            
-            if not config:
-                await self._send_error_response(websocket, "Missing config data")
-                return
-            
-            # Log the configuration update
-            logger.info(f"NEMA configuration updated: {config}")
-            
-            # Create stepper command to update configuration
-            stepper_data = {
-                "command": "update_config",
-                "config": config
-            }
-            
-            # Send to hardware service
-            response = await self.hardware_service.handle_stepper_command(stepper_data)
-            
-            await self._send_websocket_message(websocket, {
-                "type": "nema_config_updated",
-                "success": response.get("success", False),
-                "config": config,
-                "message": response.get("message", ""),
-                "timestamp": time.time()
-            })
-            
-        except Exception as e:
-            logger.error(f"NEMA config update error: {e}")
-            await self._send_error_response(websocket, f"NEMA config error: {str(e)}")
+        config = data.get("config")
+        
+        if not config:
+            await self._send_error_response(websocket, "Missing config data")
+            return
+        
+        # Log the configuration update
+        logger.info(f"NEMA configuration updated: {config}")
+        
+        # Create stepper command to update configuration
+        stepper_data = {
+            "command": "update_config",
+            "config": config
+        }
+        
+        # Send to hardware service
+        response = await self.hardware_service.handle_stepper_command(stepper_data)
+        
+        await self._send_ack(
+            websocket, "nema_config_updated", response.get("success", False),
+            response.get("message", ""), config=config
+        )
 
 
+    @ws_errors("NEMA home error")
     async def _handle_nema_home(self, websocket, data: Dict[str, Any]):
         """Handle NEMA homing command"""
-        try:
-            # Create stepper command for homing
-            stepper_data = {
-                "command": "home"
-            }
-            
-            response = await self.hardware_service.handle_stepper_command(stepper_data)
-            
-            await self._send_websocket_message(websocket, {
-                "type": "nema_home_response",
-                "success": response.get("success", False),
-                "message": response.get("message", ""),
-                "timestamp": time.time()
+        # Create stepper command for homing
+        stepper_data = {
+            "command": "home"
+        }
+        
+        response = await self.hardware_service.handle_stepper_command(stepper_data)
+        
+        reply = {
+            "type": "nema_home_response",
+            "success": response.get("success", False),
+            "message": response.get("message", ""),
+            # Homing takes seconds - stamp the completion, not the request
+            "timestamp": time.time()
+        }
+        
+        # If successful, broadcast homing complete
+        if response.get("success"):
+            await self._reply_and_broadcast(websocket, reply, {
+                "type": "nema_homing_complete",
+                "success": True,
+                "timestamp": reply["timestamp"]
             })
-            
-            # If successful, broadcast homing complete
-            if response.get("success"):
-                await self.backend.broadcast_message({
-                    "type": "nema_homing_complete",
-                    "success": True,
-                    "timestamp": time.time()
-                })
-            
-        except Exception as e:
-            logger.error(f"NEMA home error: {e}")
-            await self._send_error_response(websocket, f"NEMA home error: {str(e)}")
+        else:
+            await self._send_websocket_message(websocket, reply)
 
+    @ws_errors("NEMA enable error")
     async def _handle_nema_enable(self, websocket, data: Dict[str, Any]):
         """Handle NEMA enable/disable command"""
-        try:
-            enabled = data.get("enabled", True)
-            
-            # Create stepper command
-            stepper_data = {
-                "command": "enable" if enabled else "disable"
-            }
-            
-            response = await self.hardware_service.handle_stepper_command(stepper_data)
-            
-            await self._send_websocket_message(websocket, {
-                "type": "nema_enable_response",
-                "success": response.get("success", False),
-                "enabled": enabled,
-                "message": response.get("message", ""),
-                "timestamp": time.time()
-            })
-            
-        except Exception as e:
-            logger.error(f"NEMA enable error: {e}")
-            await self._send_error_response(websocket, f"NEMA enable error: {str(e)}")
+        enabled = data.get("enabled", True)
+        
+        # Create stepper command
+        stepper_data = {
+            "command": "enable" if enabled else "disable"
+        }
+        
+        response = await self.hardware_service.handle_stepper_command(stepper_data)
+        
+        await self._send_ack(
+            websocket, "nema_enable_response", response.get("success", False),
+            response.get("message", ""), enabled=enabled
+        )
 
+    @ws_errors("NEMA status error")
     async def _handle_nema_get_status(self, websocket, data: Dict[str, Any]):
         """Handle NEMA status request"""
-        try:
-            # Create stepper command for status
-            stepper_data = {
-                "command": "get_status"
-            }
-            
-            response = await self.hardware_service.handle_stepper_command(stepper_data)
-            
-            if response.get("success") and "status" in response:
-                # Send comprehensive status
-                status = response["status"]
-                await self._send_websocket_message(websocket, {
-                    "type": "nema_status",
-                    "status": {
-                        "state": status.get("state", "unknown"),
-                        "homed": status.get("homed", False),
-                        "enabled": status.get("enabled", False),
-                        "position_cm": status.get("position_cm", 0.0),
-                        "target_cm": status.get("target_cm", 0.0),
-                        "limit_switch": status.get("limit_switch", False),
-                        "safe_position": status.get("safe_position", True)
-                    },
-                    "timestamp": time.time()
-                })
-            else:
-                await self._send_error_response(websocket, "Failed to get NEMA status")
-            
-        except Exception as e:
-            logger.error(f"NEMA get status error: {e}")
-            await self._send_error_response(websocket, f"NEMA status error: {str(e)}")
+        # Create stepper command for status
+        stepper_data = {
+            "command": "get_status"
+        }
+        
+        response = await self.hardware_service.handle_stepper_command(stepper_data)
+        
+        if response.get("success") and "status" in response:
+            # Send comprehensive status
+            status = response["status"]
+            await self._send_websocket_message(websocket, {
+                "type": "nema_status",
+                "status": {
+                    "state": status.get("state", "unknown"),
+                    "homed": status.get("homed", False),
+                    "enabled": status.get("enabled", False),
+                    "position_cm": status.get("position_cm", 0.0),
+                    "target_cm": status.get("target_cm", 0.0),
+                    "limit_switch": status.get("limit_switch", False),
+                    "safe_position": status.get("safe_position", True)
+                },
+                "timestamp": self._now()
+            })
+        else:
+            await self._send_error_response(websocket, "Failed to get NEMA status")
 
     async def _handle_get_all_servo_positions(self, websocket, data: Dict[str, Any]):
         """Handle request for all servo positions"""
@@ -1124,8 +1472,14 @@ class WebSocketMessageHandler:
         maestro_info = await self.hardware_service.get_maestro_info(maestro_num)
         actual_channels = maestro_info.get("channels", 18) if maestro_info else 18
 
-        # Store the current event loop
-        current_loop = asyncio.get_running_loop()
+        # Bind the scheduler once for the callback. It normally fires on the
+        # serial thread; when it fires on the loop thread the frame is
+        # queued directly, skipping the threadsafe lock and self-pipe wakeup.
+        call_soon_threadsafe = self._get_loop().call_soon_threadsafe
+        send_frame_soon = self._send_frame_soon
+        wire_format_for = self.wire_format_for
+        loop_thread = threading.get_ident()
+        get_ident = threading.get_ident
         
         def batch_callback(positions_dict):
             """Synchronous callback that schedules async work safely"""
@@ -1138,11 +1492,17 @@ class WebSocketMessageHandler:
                 "timestamp": time.time()
             }
             
-            # Use call_soon_threadsafe to schedule the coroutine safely
-            def send_response():
-                asyncio.create_task(self._send_websocket_message(websocket, response))
-            
-            current_loop.call_soon_threadsafe(send_response)
+            # Encode here in the serial thread; the loop only enqueues the frame.
+            # Never let an encode or scheduling failure escape into the
+            # hardware thread's read loop.
+            try:
+                frame = encode_message(response, wire_format_for(websocket))
+                if get_ident() == loop_thread:
+                    send_frame_soon(websocket, frame)
+                else:
+                    call_soon_threadsafe(send_frame_soon, websocket, frame)
+            except Exception as e:
+                logger.error(f"Failed to send websocket message: {e}")
         
         success = await self.hardware_service.get_all_servo_positions(maestro_num, batch_callback)
         if not success:
@@ -1156,13 +1516,12 @@ class WebSocketMessageHandler:
         try:
             info = await self.hardware_service.get_maestro_info(maestro_num)
             if info:
-                response = {
-                    "type": "maestro_info",
-                    "maestro": maestro_num,
-                    **info,
-                    "timestamp": time.time()
-                }
-                await self._send_websocket_message(websocket, response)
+                # get_maestro_info builds a fresh dict per call - fill it in
+                # place rather than copying every key into a new response
+                info["type"] = "maestro_info"
+                info["maestro"] = maestro_num
+                info["timestamp"] = self._now()
+                await self._send_websocket_message(websocket, info)
             else:
                 await self._send_error_response(websocket, f"Failed to get info for Maestro {maestro_num}")
         except Exception as e:
@@ -1177,8 +1536,14 @@ class WebSocketMessageHandler:
             await self._send_error_response(websocket, "Missing channel")
             return
         
-        # Store the current event loop
-        current_loop = asyncio.get_running_loop()
+        # Bind the scheduler once for the callback. It normally fires on the
+        # serial thread; when it fires on the loop thread the frame is
+        # queued directly, skipping the threadsafe lock and self-pipe wakeup.
+        call_soon_threadsafe = self._get_loop().call_soon_threadsafe
+        send_frame_soon = self._send_frame_soon
+        wire_format_for = self.wire_format_for
+        loop_thread = threading.get_ident()
+        get_ident = threading.get_ident
         
         def position_callback(position):
             """Synchronous callback that schedules async work safely"""
@@ -1189,11 +1554,17 @@ class WebSocketMessageHandler:
                 "timestamp": time.time()
             }
             
-            # Use call_soon_threadsafe to schedule the coroutine safely
-            def send_response():
-                asyncio.create_task(self._send_websocket_message(websocket, response))
-            
-            current_loop.call_soon_threadsafe(send_response)
+            # Encode here in the serial thread; the loop only enqueues the frame.
+            # Never let an encode or scheduling failure escape into the
+            # hardware thread's read loop.
+            try:
+                frame = encode_message(response, wire_format_for(websocket))
+                if get_ident() == loop_thread:
+                    send_frame_soon(websocket, frame)
+                else:
+                    call_soon_threadsafe(send_frame_soon, websocket, frame)
+            except Exception as e:
+                logger.error(f"Failed to send websocket message: {e}")
         
         success = await self.hardware_service.get_servo_position(channel_key, position_callback)
         if not success:
@@ -1229,13 +1600,13 @@ class WebSocketMessageHandler:
             return
 
         # Fire-and-forget so we don't block controller message handling
-        asyncio.create_task(self.scene_engine.play_scene(emotion))
+        _create_background_task(self.scene_engine.play_scene(emotion))
 
         # Optional: immediate ack so UI gets feedback
         await self._send_websocket_message(websocket, {
             "type": "scene_queued",
             "scene_name": emotion,
-            "timestamp": time.time()
+            "timestamp": self._now()
         })
 
     
@@ -1248,11 +1619,11 @@ class WebSocketMessageHandler:
                 "type": "scene_list",
                 "scenes": scenes,
                 "count": len(scenes),
-                "timestamp": time.time()
+                "timestamp": self._now()
             }
             
             await self._send_websocket_message(websocket, response)
-            logger.info(f"[SERVO] Sent {len(scenes)} scenes to client")
+            logger.info("[SERVO] Sent %d scenes to client", len(scenes))
             
         except Exception as e:
             logger.error(f"Failed to get scenes: {e}")
@@ -1267,14 +1638,16 @@ class WebSocketMessageHandler:
                 await self._send_error_response(websocket, "Scenes data must be a list")
                 return
             
-            # Validate scenes data
-            for i, scene in enumerate(scenes):
-                if not isinstance(scene, dict):
-                    await self._send_error_response(websocket, f"Scene {i} must be a dictionary")
-                    return
-                if not scene.get("label", "").strip():
-                    await self._send_error_response(websocket, f"Scene {i} must have a non-empty label")
-                    return
+            # Validate scenes data - single pass in the common all-valid case,
+            # locating the offending scene only when validation fails
+            if not all(isinstance(scene, dict) and scene.get("label", "").strip() for scene in scenes):
+                for i, scene in enumerate(scenes):
+                    if not isinstance(scene, dict):
+                        await self._send_error_response(websocket, f"Scene {i} must be a dictionary")
+                        return
+                    if not scene.get("label", "").strip():
+                        await self._send_error_response(websocket, f"Scene {i} must have a non-empty label")
+                        return
             
             # Save scenes
             success = await self.scene_engine.save_scenes(scenes)
@@ -1284,18 +1657,18 @@ class WebSocketMessageHandler:
                 "success": success,
                 "count": len(scenes) if success else 0,
                 "message": "Scenes saved successfully" if success else "Failed to save scenes",
-                "timestamp": time.time()
+                "timestamp": self._now()
             }
             
-            await self._send_websocket_message(websocket, response)
-            
             # Broadcast to all clients that scenes were updated
             if success:
-                await self.backend.broadcast_message({
+                await self._reply_and_broadcast(websocket, response, {
                     "type": "scenes_updated",
                     "count": len(scenes),
-                    "timestamp": time.time()
+                    "timestamp": self._now()
                 })
+            else:
+                await self._send_websocket_message(websocket, response)
             
         except Exception as e:
             logger.error(f"Failed to save scenes: {e}")
@@ -1331,7 +1704,7 @@ class WebSocketMessageHandler:
                 track = data.get("track")
                 if track:
                     success = self.audio_controller.play_track(track)
-                    logger.info(f" Audio play '{track}': {'[OK]' if success else ' '}")
+                    logger.info(" Audio play '%s': %s", track, "[OK]" if success else " ")
                     if not success:
                         await self._send_error_response(websocket, f"Failed to play track: {track}")
                 else:
@@ -1344,7 +1717,7 @@ class WebSocketMessageHandler:
             elif command == "volume":
                 volume = data.get("volume", 0.5)
                 self.audio_controller.set_volume(volume)
-                logger.info(f" Audio volume set to {volume}")
+                logger.info(" Audio volume set to %s", volume)
                 
             else:
                 await self._send_error_response(websocket, f"Unknown audio command: {command}")
@@ -1362,11 +1735,11 @@ class WebSocketMessageHandler:
                 "type": "audio_files",
                 "files": audio_files,
                 "count": len(audio_files),
-                "timestamp": time.time()
+                "timestamp": self._now()
             }
             
             await self._send_websocket_message(websocket, response)
-            logger.info(f"🔋 Sent {len(audio_files)} audio files to client")
+            logger.info("🔋 Sent %d audio files to client", len(audio_files))
             
         except Exception as e:
             logger.error(f"Failed to get audio files: {e}")
@@ -1385,11 +1758,11 @@ class WebSocketMessageHandler:
                 "type": "backend_refresh_response",
                 "audio_files": audio_files,
                 "bottango_scenes": bottango_scenes,
-                "timestamp": time.time()
+                "timestamp": self._now()
             }
             
             await self._send_websocket_message(websocket, response)
-            logger.info(f"📄 Sent refresh response: {len(audio_files)} audio files, {len(bottango_scenes)} Bottango scenes")
+            logger.info("📄 Sent refresh response: %d audio files, %d Bottango scenes", len(audio_files), len(bottango_scenes))
             
         except Exception as e:
             logger.error(f"âŒ Error handling refresh_backend: {e}")
@@ -1397,7 +1770,7 @@ class WebSocketMessageHandler:
                 "type": "backend_refresh_response",
                 "audio_files": [],
                 "bottango_scenes": [],
-                "timestamp": time.time()
+                "timestamp": self._now()
             })
     
     async def _get_bottango_scenes(self) -> list:
@@ -1414,7 +1787,7 @@ class WebSocketMessageHandler:
                 if scenes_dir.exists():
                     for fp in sorted(scenes_dir.glob("*.json")):
                         try:
-                            data = json.loads(fp.read_text(encoding='utf-8'))
+                            data = decode_message(fp.read_text(encoding='utf-8'))
                             name = data.get('name') or fp.stem
                             if 'duration' in data:
                                 duration = float(data.get('duration') or 0.0)
@@ -1432,14 +1805,14 @@ class WebSocketMessageHandler:
                                 ch_count = 0
                             scenes.append({'name': str(name), 'duration': float(duration), 'channels': int(ch_count)})
                         except Exception as e:
-                            logger.debug(f"Skipping scene file {fp.name}: {e}")
+                            logger.debug("Skipping scene file %s: %s", fp.name, e)
 
                 # Fallback to registry if the folder doesn't exist or yields nothing
                 if not scenes:
                     registry_path = Path("configs/scenes_registry.json")
                     if registry_path.exists():
                         try:
-                            registry = json.loads(registry_path.read_text(encoding='utf-8'))
+                            registry = decode_message(registry_path.read_text(encoding='utf-8'))
                             for scene_name, scene_data in (registry or {}).items():
                                 try:
                                     duration = float(scene_data.get('duration', 0.0) or 0.0)
@@ -1461,7 +1834,7 @@ class WebSocketMessageHandler:
                     seen.add(n)
                     deduped.append(s)
 
-                logger.debug(f"Loaded {len(deduped)} Bottango scenes")
+                logger.debug("Loaded %d Bottango scenes", len(deduped))
                 return deduped
             except Exception as e:
                 logger.error(f"Failed to enumerate Bottango scenes: {e}")
@@ -1477,7 +1850,7 @@ class WebSocketMessageHandler:
         await self.backend.broadcast_message({
             "type": "emergency_stop",
             "source": "websocket_command",
-            "timestamp": time.time()
+            "timestamp": self._now()
         })
     
     async def _handle_system_status_request(self, websocket, data: Dict[str, Any]):
@@ -1488,10 +1861,10 @@ class WebSocketMessageHandler:
             # Add additional system info
             status.update({
                 "type": "system_status",
-                "timestamp": time.time(),
+                "timestamp": self._now(),
                 "websocket_handler": {
-                    "message_types": len(self.handlers),
-                    "available_handlers": list(self.handlers.keys())
+                    "message_types": self._handler_stats["total_handlers"],
+                    "available_handlers": self._handler_stats["handler_types"]
                 }
             })
 
@@ -1554,73 +1927,85 @@ class WebSocketMessageHandler:
         gesture_name = data.get("name")
         confidence = data.get("confidence", 1.0)
         
-        logger.info(f" Gesture detected: {gesture_name} (confidence: {confidence})")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(" Gesture detected: %s (confidence: %s)", gesture_name, confidence)
         
-        # Map gesture names to scene names
-        gesture_scene_mapping = {
-            "left_wave": "left hand wave",
-            "right_wave": "right hand wave", 
-            "hands_up": "hands up",
-        }
-        
-        scene_name = gesture_scene_mapping.get(gesture_name)
+        scene_name = self.GESTURE_SCENES.get(gesture_name)
         if scene_name:
-            try:
-                # SOLUTION: Temporarily disable all callbacks to avoid deadlock
-                original_started = self.scene_engine.scene_started_callback
-                original_completed = self.scene_engine.scene_completed_callback
-                original_error = self.scene_engine.scene_error_callback
-                
-                # Disable callbacks completely
-                self.scene_engine.scene_started_callback = None
-                self.scene_engine.scene_completed_callback = None
-                self.scene_engine.scene_error_callback = None
-                
-                # Play scene without any callbacks
-                success = await self.scene_engine.play_scene(scene_name)
-                
-                # Restore callbacks immediately
-                self.scene_engine.scene_started_callback = original_started
-                self.scene_engine.scene_completed_callback = original_completed
-                self.scene_engine.scene_error_callback = original_error
-                
-                logger.info(f" Triggered scene '{scene_name}' for gesture '{gesture_name}' (no callbacks)")
-                
-            except Exception as e:
-                # Always restore callbacks even on error
-                self.scene_engine.scene_started_callback = original_started
-                self.scene_engine.scene_completed_callback = original_completed
-                self.scene_engine.scene_error_callback = original_error
-                logger.error(f"Failed to trigger scene '{scene_name}': {e}")
+            # Handed off to the scene worker so gesture ingest never waits on the scene engine
+            self._trigger_gesture_scene(scene_name, gesture_name)
         else:
             logger.warning(f"No scene mapping found for gesture: {gesture_name}")
         
         # Broadcast gesture event (this should work since it's outside callback context)
-        await self.backend.broadcast_message({
+        self._queue_event({
             "type": "gesture_detected",
             "name": gesture_name,
             "confidence": confidence,
             "scene_triggered": scene_name,
-            "timestamp": time.time()
+            "timestamp": self._now()
         })
 
+    def _trigger_gesture_scene(self, scene_name: str, gesture_name: str):
+        """Signal the scene worker to play a gesture scene; the latest gesture wins"""
+        if self._scene_worker is None:
+            self._scene_trigger = asyncio.Event()
+            self._scene_worker = _create_background_task(self._gesture_scene_worker())
+        self._pending_scene = (scene_name, gesture_name)
+        self._scene_trigger.set()
+
+    async def stop_gesture_worker(self):
+        """Cancel the gesture scene worker, if one was started, and wait for it"""
+        worker = self._scene_worker
+        if worker is None:
+            return
+        self._scene_worker = None
+        worker.cancel()
+        try:
+            await worker
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.debug("Gesture scene worker stopped with error: %s", e)
+
+    async def _gesture_scene_worker(self):
+        """Play gesture-triggered scenes one at a time as they are signalled"""
+        while True:
+            await self._scene_trigger.wait()
+            self._scene_trigger.clear()
+            scene_name, gesture_name = self._pending_scene
+            await self._play_gesture_scene(scene_name, gesture_name)
+
+    async def _play_gesture_scene(self, scene_name: str, gesture_name: str):
+        """Play a scene for a gesture with the scene engine callbacks disabled"""
+        # SOLUTION: Temporarily disable all callbacks to avoid deadlock
+        original_started = self.scene_engine.scene_started_callback
+        original_completed = self.scene_engine.scene_completed_callback
+        original_error = self.scene_engine.scene_error_callback
+        try:
+            # Disable callbacks completely
+            self.scene_engine.scene_started_callback = None
+            self.scene_engine.scene_completed_callback = None
+            self.scene_engine.scene_error_callback = None
+            
+            # Play scene without any callbacks
+            await self.scene_engine.play_scene(scene_name)
+            
+            logger.info(" Triggered scene '%s' for gesture '%s' (no callbacks)", scene_name, gesture_name)
+            
+        except Exception as e:
+            logger.error(f"Failed to trigger scene '{scene_name}': {e}")
+        finally:
+            # Always restore callbacks, even on error
+            self.scene_engine.scene_started_callback = original_started
+            self.scene_engine.scene_completed_callback = original_completed
+            self.scene_engine.scene_error_callback = original_error
+
     async def _handle_get_gesture_stats(self, websocket, data: Dict[str, Any]):
         """Get gesture detection statistics"""
         try:
             # This would be called by the frontend to get gesture detection status
-            stats = {
-                "type": "gesture_stats",
-                "supported_gestures": ["left_wave", "right_wave", "hands_up"],
-                "scene_mappings": {
-                    "left_wave": "left_wave_response",
-                    "right_wave": "right_wave_response", 
-                    "hands_up": "hands_up_response"
-                },
-                "detection_enabled": True,  # This would come from system state
-                "timestamp": time.time()
-            }
-            
-            await self._send_websocket_message(websocket, stats)
+            await self._send_static_response(websocket, "gesture_stats")
             
         except Exception as e:
             logger.error(f"Error getting gesture stats: {e}")
@@ -1630,32 +2015,71 @@ class WebSocketMessageHandler:
     async def _handle_tracking(self, websocket, data: Dict[str, Any]):
         """Handle tracking enable/disable"""
         state = data.get("state", False)
-        logger.info(f"[SERVO] Tracking {'enabled' if state else 'disabled'}")
+        # UI toggle spam often repeats the current state - nothing to broadcast
+        if state == self._last_tracking_state:
+            return
+        self._last_tracking_state = state
+        logger.info("[SERVO] Tracking %s", "enabled" if state else "disabled")
         
         # Broadcast tracking state to all clients
-        await self.backend.broadcast_message({
+        self._queue_event({
             "type": "tracking_state_changed",
             "enabled": state,
-            "timestamp": time.time()
+            "timestamp": self._now()
         })
     
     # ==================== UTILITY HANDLERS ====================
     
     async def _handle_heartbeat(self, websocket, data: Dict[str, Any]):
         """Handle heartbeat ping"""
+        await self._send_static_response(websocket, "heartbeat_response")
+    
+    async def _handle_set_wire_format(self, websocket, data: Dict[str, Any]):
+        """Switch this client's outbound frames between JSON and MessagePack.
+
+        "batch": true additionally opts the client in to {"type": "batch",
+        "messages": [...]} frames carrying several messages at once.
+        """
+        wire_format = data.get("format", WIRE_JSON)
+        batch = bool(data.get("batch", websocket in self._batch_clients))
+
+        if wire_format not in (WIRE_JSON, WIRE_MSGPACK):
+            await self._send_error_response(websocket, f"Unknown wire format: {wire_format}")
+            return
+
+        if wire_format == WIRE_MSGPACK and not MSGPACK_AVAILABLE:
+            wire_format = WIRE_JSON
+            logger.warning("Client requested MessagePack but msgpack is not installed - staying on JSON")
+
+        if wire_format == WIRE_JSON:
+            self._wire_formats.pop(websocket, None)
+        else:
+            self._wire_formats[websocket] = wire_format
+
+        if batch:
+            self._batch_clients.add(websocket)
+        else:
+            self._batch_clients.discard(websocket)
+        writer = self._writers.get(websocket)
+        if writer:
+            writer.merge_json = batch
+
         await self._send_websocket_message(websocket, {
-            "type": "heartbeat_response",
-            "timestamp": time.time()
+            "type": "wire_format",
+            "format": wire_format,
+            "batch": batch,
+            "msgpack_available": MSGPACK_AVAILABLE,
+            "timestamp": self._now()
         })
-    
+
     async def _handle_failsafe(self, websocket, data: Dict[str, Any]):
         """Handle failsafe mode toggle"""
         state = data.get("state", False)
-        logger.info(f"⚠️ Failsafe mode {'activated' if state else 'deactivated'}")
+        logger.info("Failsafe mode %s", "activated" if state else "deactivated")
         
         # Update backend state
-        if hasattr(self.backend, 'set_failsafe_mode'):
-            await self.backend.set_failsafe_mode(state)
+        if self._set_failsafe is not None:
+            await self._set_failsafe(state)
 
         # Broadcast confirmed state to ALL clients so every frontend stays in sync
         await self.backend.broadcast_message({
@@ -1677,35 +2101,11 @@ class WebSocketMessageHandler:
             mode_name = data.get("name")
             state = data.get("state", True)
             
-            logger.info(f"📄 Mode '{mode_name}' {'activated' if state else 'deactivated'}")
+            logger.info("Mode '%s' %s", mode_name, "activated" if state else "deactivated")
             
-            # Handle different modes
-            if mode_name == "idle":
-                # Toggle idle mode in scene engine
-                if hasattr(self.scene_engine, 'set_idle_mode'):
-                    self.scene_engine.set_idle_mode(state)
-                    logger.info(f"ðŸŒ™ Idle mode {'ENABLED' if state else 'DISABLED'} via frontend")
-                    
-                    # Send confirmation back to frontend
-                    await self._send_response(websocket, {
-                        "type": "mode_response",
-                        "mode": "idle",
-                        "state": state,
-                        "success": True
-                    })
-                else:
-                    logger.error("Scene engine does not support idle mode (missing set_idle_mode method)")
-                    await self._send_error_response(websocket, "Idle mode not available")
-                    
-            elif mode_name == "demo":
-                logger.warning("Demo mode not yet implemented")
-                await self._send_response(websocket, {
-                    "type": "mode_response",
-                    "mode": "demo",
-                    "state": state,
-                    "success": False,
-                    "message": "Demo mode not yet implemented"
-                })
+            mode_handler = self._mode_handlers.get(mode_name)
+            if mode_handler:
+                await mode_handler(websocket, state)
             else:
                 logger.warning(f"Unknown mode: {mode_name}")
                 await self._send_error_response(websocket, f"Unknown mode: {mode_name}")
@@ -1713,13 +2113,209 @@ class WebSocketMessageHandler:
         except Exception as e:
             logger.error(f"Error handling mode control: {e}")
             await self._send_error_response(websocket, f"Mode error: {str(e)}")
+
+    async def _mode_idle(self, websocket, state: bool):
+        """Toggle idle mode in the scene engine"""
+        if hasattr(self.scene_engine, 'set_idle_mode'):
+            self.scene_engine.set_idle_mode(state)
+            logger.info("Idle mode %s via frontend", "ENABLED" if state else "DISABLED")
+            
+            # Send confirmation back to frontend
+            await self._send_websocket_message(websocket, {
+                "type": "mode_response",
+                "mode": "idle",
+                "state": state,
+                "success": True
+            })
+        else:
+            logger.error("Scene engine does not support idle mode (missing set_idle_mode method)")
+            await self._send_error_response(websocket, "Idle mode not available")
+
+    async def _mode_demo(self, websocket, state: bool):
+        """Demo mode placeholder"""
+        logger.warning("Demo mode not yet implemented")
+        await self._send_websocket_message(websocket, {
+            "type": "mode_response",
+            "mode": "demo",
+            "state": state,
+            "success": False,
+            "message": "Demo mode not yet implemented"
+        })
     
     # ==================== UTILITY METHODS ====================
     
+    def wire_format_for(self, websocket) -> str:
+        """Return the negotiated wire format for a client (JSON by default)"""
+        return self._wire_formats.get(websocket, WIRE_JSON)
+
+    def accepts_batch(self, websocket) -> bool:
+        """True if the client opted in to {"type": "batch"} frames"""
+        return websocket in self._batch_clients
+
+    def client_connected(self, websocket):
+        """Start the outbound queue for a newly connected client"""
+        if websocket not in self._writers:
+            self._writers[websocket] = ConnectionWriter(websocket)
+
+    def client_disconnected(self, websocket):
+        """Drop per-connection state when a client goes away"""
+        self._wire_formats.pop(websocket, None)
+        self._batch_clients.discard(websocket)
+        writer = self._writers.pop(websocket, None)
+        if writer:
+            writer.close()
+
+    async def send_frame(self, websocket, frame):
+        """Send an already-encoded frame through the client's queue.
+
+        Falls back to a direct send, bounded by DIRECT_SEND_TIMEOUT, for
+        connections without a writer.
+        """
+        writer = self._writers.get(websocket)
+        if writer:
+            writer.send_nowait(frame)
+        else:
+            await asyncio.wait_for(websocket.send(frame), DIRECT_SEND_TIMEOUT)
+
+    def _send_frame_soon(self, websocket, frame):
+        """Queue an encoded frame without awaiting - event loop thread only"""
+        writer = self._writers.get(websocket)
+        if writer:
+            writer.send_nowait(frame)
+        else:
+            _create_background_task(self._send_encoded(websocket, frame))
+
+    async def _send_encoded(self, websocket, frame):
+        """Send an encoded frame with error handling"""
+        try:
+            await self.send_frame(websocket, frame)
+        except Exception as e:
+            logger.error(f"Failed to send websocket message: {e}")
+
+    async def _send_batch(self, websocket, messages: list):
+        """Send several messages to one client - one frame if it accepts batches"""
+        if len(messages) > 1 and websocket in self._batch_clients:
+            await self._send_websocket_message(websocket, {
+                "type": "batch",
+                "messages": messages
+            })
+            return
+        for message in messages:
+            await self._send_websocket_message(websocket, message)
+
+    async def _reply_and_broadcast(self, websocket, reply: dict, broadcast: dict):
+        """Send a reply to the requester followed by a broadcast to everyone.
+
+        Batch-capable requesters get both in a single frame and are left out
+        of the broadcast fan-out; other clients see no change.
+        """
+        if websocket in self._batch_clients:
+            await self._send_batch(websocket, [reply, broadcast])
+            await self.backend.broadcast_message(broadcast, exclude=websocket)
+        else:
+            await self._send_websocket_message(websocket, reply)
+            await self.backend.broadcast_message(broadcast)
+
+    def _queue_broadcast(self, key: str, message: dict):
+        """Queue a broadcast; within the coalesce window the last message per key wins"""
+        self._pending_broadcasts[key] = message
+        self._schedule_flush()
+
+    def _queue_event(self, message: dict):
+        """Queue an event broadcast; events in the same window share one batch frame"""
+        self._pending_events.append(message)
+        if len(self._pending_events) >= MAX_EVENT_BATCH:
+            events, self._pending_events = self._pending_events, []
+            _create_background_task(self._send_queued(events))
+        else:
+            self._schedule_flush()
+
+    def _schedule_flush(self):
+        if self._broadcast_flush is None:
+            self._broadcast_flush = _create_background_task(self._flush_broadcasts())
+
+    async def _flush_broadcasts(self):
+        """Send every queued broadcast once the coalesce window has elapsed"""
+        await asyncio.sleep(BROADCAST_COALESCE_WINDOW)
+        pending, self._pending_broadcasts = self._pending_broadcasts, {}
+        events, self._pending_events = self._pending_events, []
+        # Anything queued while these sends are in flight starts a new window
+        self._broadcast_flush = None
+        await self._send_queued(events + list(pending.values()))
+
+    async def _send_queued(self, messages: list):
+        """Broadcast queued messages - as one batch frame to clients that accept it"""
+        if not messages:
+            return
+        try:
+            await self.backend.broadcast_messages(messages)
+        except Exception as e:
+            logger.error(f"Failed to send {len(messages)} queued broadcast(s): {e}")
+
     async def _send_websocket_message(self, websocket, message: dict):
         """Send message to specific websocket client with error handling"""
         try:
-            await websocket.send(json.dumps(message))
+            await self.send_frame(websocket, encode_message(message, self.wire_format_for(websocket)))
+        except Exception as e:
+            logger.error(f"Failed to send websocket message: {e}")
+
+    async def _send_static_response(self, websocket, response_type: str):
+        """Send a STATIC_RESPONSES entry, splicing the timestamp into its cached JSON"""
+        ts = self._now()
+        if self.wire_format_for(websocket) != WIRE_JSON:
+            await self._send_websocket_message(
+                websocket, {**self.STATIC_RESPONSES[response_type], "timestamp": ts}
+            )
+            return
+        try:
+            await self.send_frame(websocket, f"{self._static_json_prefixes[response_type]}{ts!r}}}")
+        except Exception as e:
+            logger.error(f"Failed to send websocket message: {e}")
+
+    async def _send_ack(self, websocket, response_type: str, success: bool, message: str,
+                        timestamp: Optional[float] = None, **extras):
+        """Send a {"type", "success", "message", ...extras, "timestamp"} acknowledgement.
+
+        JSON clients get the frame spliced from a cached per-type head, so
+        only the message and any extras go through the encoder. timestamp
+        defaults to the dispatch time.
+        """
+        ts = self._now() if timestamp is None else timestamp
+        wire_format = self.wire_format_for(websocket)
+        try:
+            if wire_format == WIRE_JSON:
+                prefix = _ACK_JSON_PREFIXES.get(response_type)
+                if prefix is None:
+                    prefix = _ACK_JSON_PREFIXES[response_type] = (
+                        f'{{"type":{encode_json(response_type)},"success":'
+                    )
+                extra_json = f",{encode_json(extras)[1:-1]}" if extras else ""
+                frame = (
+                    f'{prefix}{"true" if success else "false"},"message":{encode_json(message)}'
+                    f'{extra_json},"timestamp":{ts!r}}}'
+                )
+            else:
+                frame = encode_message({
+                    "type": response_type,
+                    "success": bool(success),
+                    "message": message,
+                    **extras,
+                    "timestamp": ts
+                }, wire_format)
+            await self.send_frame(websocket, frame)
+        except Exception as e:
+            logger.error(f"Failed to send websocket message: {e}")
+
+    async def _send_constant_response(self, websocket, response_type: str):
+        """Send a CONSTANT_RESPONSES entry, encoding it only once per wire format"""
+        key = (response_type, self.wire_format_for(websocket))
+        frame = self._constant_frames.get(key)
+        if frame is None:
+            frame = self._constant_frames[key] = encode_message(
+                self.CONSTANT_RESPONSES[response_type], key[1]
+            )
+        try:
+            await self.send_frame(websocket, frame)
         except Exception as e:
             logger.error(f"Failed to send websocket message: {e}")
 
@@ -1728,13 +2324,13 @@ class WebSocketMessageHandler:
         volume = data.get('volume', 70)
         volume_float = volume / 100.0  # Convert to 0.0-1.0
         
-        logger.info(f"Setting system volume to {volume}%")
+        logger.info("Setting system volume to %s%%", volume)
         
         try:
             # Set audio controller volume (for audio playback)
             if self.audio_controller:
                 self.audio_controller.set_volume(volume_float)
-                logger.info(f"[OK] Audio controller volume set to {volume_float:.2f}")
+                logger.info("[OK] Audio controller volume set to %.2f", volume_float)
             
             # Save to hardware_config.json for persistence - existing values
             # are preserved because we load, merge, then save atomically
@@ -1815,7 +2411,7 @@ class WebSocketMessageHandler:
                 text=True,
                 check=True
             )
-            logger.info(f"System volume set to {volume}%")
+            logger.info("System volume set to %s%%", volume)
             return {'success': True, 'volume': volume}
             
         except subprocess.CalledProcessError as e:
@@ -1825,30 +2421,25 @@ class WebSocketMessageHandler:
     
     async def _send_error_response(self, websocket, error_message: str):
         """Send error response to websocket client"""
-        error_response = {
-            "type": "error",
-            "message": error_message,
-            "timestamp": time.time()
-        }
-        await self._send_websocket_message(websocket, error_response)
-        logger.error(f" Sent error to client: {error_message}")
+        ts = self._now()
+        wire_format = self.wire_format_for(websocket)
+        try:
+            if wire_format == WIRE_JSON:
+                # Only the message string goes through the encoder
+                frame = f"{_ERROR_JSON_PREFIX}{encode_json(error_message)},\"timestamp\":{ts!r}}}"
+            else:
+                error_buf = self._error_buf
+                error_buf["message"] = error_message
+                error_buf["timestamp"] = ts
+                frame = encode_message(error_buf, wire_format)
+            await self.send_frame(websocket, frame)
+        except Exception as e:
+            logger.error(f"Failed to send websocket message: {e}")
+        logger.error(" Sent error to client: %s", error_message)
         
     def get_handler_stats(self) -> Dict[str, Any]:
-        """Get statistics about message handling"""
-        return {
-            "total_handlers": len(self.handlers),
-            "handler_types": list(self.handlers.keys()),
-            "categories": {
-                "servo_control": 6,
-                "stepper_motor": 1,
-                "nema_control": 7,  # Add this line
-                "scene_management": 4,
-                "audio_control": 2,
-                "system_control": 3,
-                "gesture_tracking": 2,
-                "utility": 3
-            }
-        }
+        """Get statistics about message handling (cached at init - do not mutate)"""
+        return self._handler_stats
     
     async def _handle_camera_url_update(self, websocket, data: Dict[str, Any]):
         """Update ESP32 camera URL in config file and restart the proxy process"""
@@ -1970,7 +2561,7 @@ class WebSocketMessageHandler:
                 "type": "debug_levels_updated",
                 "success": True,
                 "applied": applied,
-                "timestamp": time.time()
+                "timestamp": self._now()
             })
 
         except Exception as e:
@@ -1986,17 +2577,16 @@ class WebSocketMessageHandler:
                 await self._send_error_response(websocket, "Missing config data")
                 return
             
-            # Get camera proxy URL from backend configuration
-            camera_proxy_url = getattr(self.backend, 'camera_proxy_url', 'http://10.1.1.230:8081')
+            camera_proxy_url = self.camera_proxy_url
             
             # Send settings to camera proxy - blocking HTTP call runs in the
             # executor so the event loop never stalls on a slow/absent proxy
             try:
-                import requests
-                loop = asyncio.get_running_loop()
+                camera_session = self.backend.camera_session
+                loop = self._get_loop()
                 response = await loop.run_in_executor(
                     None,
-                    lambda: requests.post(
+                    lambda: camera_session().post(
                         f"{camera_proxy_url}/camera/settings",
                         json=config,
                         timeout=5
@@ -2005,21 +2595,24 @@ class WebSocketMessageHandler:
                 
                 if response.status_code == 200:
                     result = response.json()
+                    settings = result.get("settings", config)
+                    # Stamped after the proxy round trip - one read for both messages
+                    now = time.time()
                     
                     # Send success response back to client
                     await self._send_websocket_message(websocket, {
                         "type": "camera_config_updated",
                         "success": True,
-                        "config": result.get("settings", config),
+                        "config": settings,
                         "message": result.get("message", "Settings updated successfully"),
-                        "timestamp": time.time()
+                        "timestamp": now
                     })
                     
                     # Broadcast config update to all clients
                     await self.backend.broadcast_message({
                         "type": "camera_config_broadcast",
-                        "config": result.get("settings", config),
-                        "timestamp": time.time()
+                        "config": settings,
+                        "timestamp": now
                     })
                     
                     logger.info(f"Camera configuration updated successfully")
@@ -2122,7 +2715,6 @@ class WebSocketMessageHandler:
         import tempfile
         import zipfile
         import shutil
-        import requests
         from pathlib import Path
 
         branch = data.get("branch", "main")
@@ -2184,7 +2776,7 @@ class WebSocketMessageHandler:
 
             # Download
             await _send("Downloading update from GitHub...")
-            loop = asyncio.get_running_loop()
+            loop = self._get_loop()
 
             def download():
                 tmp = Path(tempfile.mkdtemp())
@@ -2317,7 +2909,7 @@ class WebSocketMessageHandler:
                 ),
             })
 
-            loop = asyncio.get_running_loop()
+            loop = self._get_loop()
 
             def restore():
                 restored = 0
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WebSocket wire codec for the DroidDeck backend.
+
+JSON text frames remain the default wire format. Clients that opt in to
+MessagePack (by sending binary frames or a "set_wire_format" message) get
+binary frames instead - roughly 20-25% smaller and cheaper to parse than
+text JSON. Field names are identical in both formats so existing JSON
+clients keep working unchanged.
+
+JSON is encoded and parsed with orjson when it is installed (several
+times faster than the stdlib codec and far fewer allocations per frame),
+falling back to the stdlib json module otherwise.
+"""
+
+import json
+import logging
+import threading
+from typing import Any, Dict, Union
+
+logger = logging.getLogger(__name__)
+
+# orjson is optional - the stdlib json module is the fallback
+ORJSON_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    # Channel-keyed dicts (e.g. servo positions) have int keys, which the
+    # stdlib encoder stringifies - OPT_NON_STR_KEYS keeps that behaviour
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    _orjson_dumps = orjson.dumps
+    _orjson_loads = orjson.loads
+except ImportError:
+    logger.info("orjson not available - using stdlib json for WebSocket frames")
+
+# MessagePack is optional - without it every client stays on JSON
+MSGPACK_AVAILABLE = False
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    logger.info("msgpack not available - WebSocket clients limited to JSON frames")
+
+WIRE_JSON = "json"
+WIRE_MSGPACK = "msgpack"
+
+# json/orjson JSONDecodeError and every msgpack unpack error derive from ValueError
+DecodeError = (ValueError, TypeError)
+
+
+def is_binary_frame(message: Union[str, bytes, bytearray]) -> bool:
+    """True when a received frame arrived as a binary WebSocket frame."""
+    return isinstance(message, (bytes, bytearray, memoryview))
+
+
+def decode_message(message: Union[str, bytes, bytearray]) -> Dict[str, Any]:
+    """Decode an inbound frame - binary frames are MessagePack, text is JSON."""
+    if MSGPACK_AVAILABLE and is_binary_frame(message):
+        return msgpack.unpackb(message, raw=False, strict_map_key=False)
+    if ORJSON_AVAILABLE:
+        return _orjson_loads(message)
+    return json.loads(message)
+
+
+def encode_json(message: Dict[str, Any]) -> str:
+    """Encode a message as a JSON text frame.
+
+    orjson returns bytes, which websockets would send as a binary frame,
+    so the result is decoded back to str to stay a text frame for JSON
+    clients. Anything orjson refuses (e.g. ints wider than 64 bits) is
+    retried with the stdlib encoder.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return _orjson_dumps(message, option=_ORJSON_OPTIONS).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(message)
+
+
+# msgpack.packb builds and tears down a Packer (and its internal buffer)
+# on every call. Frames are encoded on the event loop and on hardware
+# callback threads, so each thread keeps one reusable Packer instead.
+_packers = threading.local()
+
+
+def encode_msgpack(message: Dict[str, Any]) -> bytes:
+    """Encode a message as a MessagePack binary frame."""
+    packer = getattr(_packers, "packer", None)
+    if packer is None:
+        packer = _packers.packer = msgpack.Packer(use_bin_type=True)
+    return packer.pack(message)
+
+
+def encode_message(message: Dict[str, Any], wire_format: str = WIRE_JSON) -> Union[str, bytes]:
+    """Encode a message for the given wire format, falling back to JSON."""
+    if wire_format == WIRE_MSGPACK and MSGPACK_AVAILABLE:
+        return encode_msgpack(message)
+    return encode_json(message)
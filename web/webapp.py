@@ -61,6 +61,8 @@ class DroidDeckWebServer:
             scene_engine = self.backend.scene_engine
 
             def on_scene_started(scene_name, scene_data):
+                if not self.has_clients:
+                    return
                 self.broadcast_message({
                     'type': 'scene_started',
                     'scene_name': scene_name,
@@ -69,6 +71,8 @@ class DroidDeckWebServer:
                 })
 
             def on_scene_completed(scene_name, scene_data, success):
+                if not self.has_clients:
+                    return
                 self.broadcast_message({
                     'type': 'scene_completed',
                     'scene_name': scene_name,
@@ -77,6 +81,8 @@ class DroidDeckWebServer:
                 })
 
             def on_scene_error(scene_name, scene_data, error):
+                if not self.has_clients:
+                    return
                 self.broadcast_message({
                     'type': 'scene_error',
                     'scene_name': scene_name,
@@ -372,8 +378,7 @@ class DroidDeckWebServer:
 
             if self.backend and hasattr(self.backend, 'scene_engine'):
                 scene_engine = self.backend.scene_engine
-                if hasattr(scene_engine, 'scenes') and scene_name in scene_engine.scenes:
-                    del scene_engine.scenes[scene_name]
+                scene_engine.delete_scene(scene_name)
 
                 self.socketio.emit('backend_message', {
                     'type': 'scene_deleted',
@@ -1409,8 +1414,22 @@ class DroidDeckWebServer:
         self.running = False
         logger.info("Droid Deck Web Server stopped")
         
+    @property
+    def has_clients(self) -> bool:
+        """True when the server is running and at least one web client is connected.
+
+        Callers should check this before building a payload so nothing is
+        allocated or encoded when nobody is listening:
+
+            if web_server.has_clients:
+                web_server.broadcast_message(build_payload())
+        """
+        return self.running and bool(self.web_clients)
+
     def broadcast_message(self, message: Dict[str, Any]):
         """Broadcast message to all web clients - called by main backend"""
+        if not self.running:
+            return
         if self.socketio and self.web_clients:
             try:
                 # Log what we're broadcasting (only for telemetry debugging)